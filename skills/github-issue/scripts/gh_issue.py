@@ -30,34 +30,65 @@ Examples:
     uv run gh_issue.py link owner/repo --parent 10 --child 42
 """
 
+import itertools
 import json
+import operator
 import os
 import re
+import shutil
 import subprocess
 import sys
+import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+from urllib.error import HTTPError
 
 import typer
-from ghapi.all import GhApi
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.markdown import Markdown
-from rich.syntax import Syntax
+
+# ghapi and the heavier rich renderables are imported where they are used,
+# so commands like `init` and `--help` start without loading them.
+if TYPE_CHECKING:
+    from ghapi.all import GhApi
 
 app = typer.Typer(help="GitHub Issue CLI")
 console = Console()
 
-# Conventional commit pattern: type(scope): description or type: description
-CONVENTIONAL_COMMIT_PATTERN = re.compile(
-    r"^(feat|fix|docs|style|refactor|perf|test|build|ci|chore|revert)(\([a-zA-Z0-9_-]+\))?!?: .+$"
+# GitHub token, resolved at most once per process (see get_token)
+_TOKEN_CACHE: Optional[str] = None
+
+# Short-lived on-disk cache for issue reads, revalidated with ETags once stale
+ISSUE_CACHE_DIR = Path.home() / ".cache" / "gh_issue"
+ISSUE_CACHE_TTL = 60  # seconds
+
+# Field accessors for the `list` table rows
+_get_name = operator.itemgetter("name")
+_get_login = operator.itemgetter("login")
+
+# Conventional commit types: type(scope): description or type: description
+CONVENTIONAL_COMMIT_TYPES = frozenset(
+    {"feat", "fix", "docs", "style", "refactor", "perf", "test", "build", "ci", "chore", "revert"}
 )
+SCOPE_PATTERN = re.compile(r"\([a-zA-Z0-9_-]+\)", re.ASCII)
+
+
+def is_conventional_title(title: str) -> bool:
+    """Check a title against the conventional commit format without regex alternation."""
+    # One trailing newline (e.g. a title pasted from a file) is allowed, as `$` did for the old regex
+    head, sep, description = title.removesuffix("\n").partition(": ")
+    if not sep or not description or "\n" in description:
+        return False
+    if head.endswith("!"):
+        head = head[:-1]
+    commit_type, paren, scope = head.partition("(")
+    if commit_type not in CONVENTIONAL_COMMIT_TYPES:
+        return False
+    return not paren or SCOPE_PATTERN.fullmatch(paren + scope) is not None
 
 
 def validate_title(title: str) -> tuple[bool, str]:
     """Validate title follows conventional commit format."""
-    if CONVENTIONAL_COMMIT_PATTERN.match(title):
+    if is_conventional_title(title):
         return True, ""
 
     return False, (
@@ -74,6 +105,8 @@ def validate_title(title: str) -> tuple[bool, str]:
 
 def preview_issue(title: str, body: str, labels: list[str] | None, assignees: list[str] | None, repo: str) -> bool:
     """Preview issue and ask for confirmation. Returns True if user confirms."""
+    from rich.markdown import Markdown
+
     console.print("\n" + "=" * 60)
     console.print("[bold cyan]ISSUE PREVIEW[/bold cyan]")
     console.print("=" * 60)
@@ -123,42 +156,135 @@ def parse_repo(repo: str) -> tuple[str, str]:
     return parts[0], parts[1]
 
 
-def get_api(owner: str, repo: str) -> GhApi:
-    """Create GhApi instance with token from environment or gh CLI."""
-    token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
-    if not token:
-        try:
-            result = subprocess.run(
-                ["gh", "auth", "token"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            token = result.stdout.strip()
-        except subprocess.CalledProcessError:
-            console.print("[red]Error: No GitHub token found. Set GITHUB_TOKEN or run 'gh auth login'[/red]")
-            raise typer.Exit(1)
-    return GhApi(owner=owner, repo=repo, token=token)
-
-
 def get_token() -> str:
-    """Get GitHub token from environment or gh CLI."""
+    """Get GitHub token from environment or gh CLI (resolved once per process)."""
+    global _TOKEN_CACHE
+    if _TOKEN_CACHE is not None:
+        return _TOKEN_CACHE
+
     token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
     if not token:
         try:
+            # An absolute executable path and close_fds=False let subprocess use
+            # posix_spawn instead of fork, which avoids copying this process's
+            # page tables just to run `gh`.
+            gh = shutil.which("gh")
+            if gh is None:
+                raise FileNotFoundError("gh")
             result = subprocess.run(
-                ["gh", "auth", "token"],
+                [gh, "auth", "token"],
                 capture_output=True,
                 text=True,
                 check=True,
+                close_fds=False,
             )
             token = result.stdout.strip()
-        except subprocess.CalledProcessError:
+        except (OSError, subprocess.CalledProcessError):
             console.print("[red]Error: No GitHub token found. Set GITHUB_TOKEN or run 'gh auth login'[/red]")
             raise typer.Exit(1)
+    _TOKEN_CACHE = token
     return token
 
 
+def get_api(owner: str, repo: str) -> "GhApi":
+    """Create GhApi instance with token from environment or gh CLI."""
+    from ghapi.all import GhApi
+
+    return GhApi(owner=owner, repo=repo, token=get_token())
+
+
+def _issue_cache_path(owner: str, repo: str, number: int) -> Path:
+    return ISSUE_CACHE_DIR / f"{owner}_{repo}_{number}.json"
+
+
+def cached_issue_get(api: "GhApi", owner: str, repo: str, number: int) -> dict:
+    """Get an issue, serving repeated reads from a local cache.
+
+    Fresh entries (younger than ISSUE_CACHE_TTL) are returned without a request.
+    Stale entries are revalidated with If-None-Match; a 304 reuses the cached body.
+    """
+    path = _issue_cache_path(owner, repo, number)
+    cached = None
+    try:
+        cached = json.loads(path.read_text())
+    except (OSError, ValueError):
+        pass
+
+    if cached and time.time() - cached.get("fetched_at", 0) < ISSUE_CACHE_TTL:
+        return cached["issue"]
+
+    headers = {"If-None-Match": cached["etag"]} if cached and cached.get("etag") else None
+    try:
+        issue = api.issues.get(number, headers=headers)
+        etag = api.recv_hdrs.get("ETag")
+    except HTTPError as e:
+        if e.code != 304 or not cached:
+            raise
+        issue, etag = cached["issue"], cached.get("etag")
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # ghapi wraps lists in fastcore L objects; default=list unwraps them
+        path.write_text(json.dumps({"fetched_at": time.time(), "etag": etag, "issue": issue}, default=list))
+    except OSError:
+        pass
+    return issue
+
+
+def invalidate_issue_cache(owner: str, repo: str, number: int) -> None:
+    """Drop the cached copy of an issue after modifying it."""
+    _issue_cache_path(owner, repo, number).unlink(missing_ok=True)
+
+
+ADD_SUB_ISSUE_MUTATION = """
+    mutation($parentId: ID!, $childId: ID!) {
+        addSubIssue(input: {issueId: $parentId, subIssueId: $childId}) {
+            issue { number }
+        }
+    }
+"""
+
+
+def graphql(api: "GhApi", query: str, **variables) -> dict:
+    """Run a GraphQL query on the API session and return its data payload."""
+    result = api("/graphql", "POST", data={"query": query, "variables": variables})
+    if result.get("errors"):
+        raise RuntimeError("; ".join(e.get("message", "") for e in result["errors"]))
+    return result.get("data") or {}
+
+
+def get_issue_node_ids(api: "GhApi", owner: str, repo: str, *numbers: int) -> list[Optional[str]]:
+    """Resolve GraphQL node IDs for several issues in a single request."""
+    params = ", ".join(f"$n{i}: Int!" for i in range(len(numbers)))
+    fields = " ".join(f"i{i}: issue(number: $n{i}) {{ id }}" for i in range(len(numbers)))
+    query = (
+        f"query($owner: String!, $repo: String!, {params}) {{ "
+        f"repository(owner: $owner, name: $repo) {{ {fields} }} }}"
+    )
+    data = graphql(api, query, owner=owner, repo=repo, **{f"n{i}": n for i, n in enumerate(numbers)})
+    repository = data.get("repository") or {}
+    return [(repository.get(f"i{i}") or {}).get("id") for i in range(len(numbers))]
+
+
+MILESTONES_QUERY = """
+    query($owner: String!, $repo: String!, $title: String!) {
+        repository(owner: $owner, name: $repo) {
+            milestones(first: 100, query: $title, states: [OPEN]) {
+                nodes { number title }
+            }
+        }
+    }
+"""
+
+
+def find_milestone_number(api: "GhApi", owner: str, repo: str, title: str) -> Optional[int]:
+    """Find an open milestone's number by exact title, filtering server-side."""
+    data = graphql(api, MILESTONES_QUERY, owner=owner, repo=repo, title=title)
+    nodes = ((data.get("repository") or {}).get("milestones") or {}).get("nodes") or []
+    by_title = {m["title"]: m["number"] for m in nodes}
+    return by_title.get(title)
+
+
 @app.command()
 def create(
     repo: str = typer.Argument(..., help="Repository in owner/repo format"),
@@ -193,7 +319,7 @@ def create(
             raise typer.Exit(1)
         body = body_file.read_text()
 
-    # Parse labels and assignees for preview
+    # Parse labels and assignees once for both preview and API call
     label_list = [l.strip() for l in labels.split(",")] if labels else None
     assignee_list = [a.strip().lstrip("@") for a in assignees.split(",")] if assignees else None
 
@@ -208,11 +334,11 @@ def create(
         # Build issue kwargs
         issue_kwargs = {"title": title, "body": body}
 
-        if labels:
-            issue_kwargs["labels"] = [l.strip() for l in labels.split(",")]
+        if label_list:
+            issue_kwargs["labels"] = label_list
 
-        if assignees:
-            issue_kwargs["assignees"] = [a.strip().lstrip("@") for a in assignees.split(",")]
+        if assignee_list:
+            issue_kwargs["assignees"] = assignee_list
 
         if milestone:
             # Try to parse as number, otherwise look up by name
@@ -220,10 +346,9 @@ def create(
                 issue_kwargs["milestone"] = int(milestone)
             except ValueError:
                 # Look up milestone by name
-                milestones = list(api.issues.list_milestones(state="open"))
-                found = next((m for m in milestones if m.get("title") == milestone), None)
-                if found:
-                    issue_kwargs["milestone"] = found.get("number")
+                milestone_number = find_milestone_number(api, owner, repo_name, milestone)
+                if milestone_number is not None:
+                    issue_kwargs["milestone"] = milestone_number
                 else:
                     console.print(f"[yellow]Warning: Milestone '{milestone}' not found[/yellow]")
 
@@ -289,7 +414,7 @@ def create_sub(
     # Prepend parent reference to body
     body_with_parent = f"Parent: #{parent}\n\n{body}"
 
-    # Parse labels and assignees for preview
+    # Parse labels and assignees once for both preview and API call
     label_list = [l.strip() for l in labels.split(",")] if labels else None
     assignee_list = [a.strip().lstrip("@") for a in assignees.split(",")] if assignees else None
 
@@ -305,11 +430,11 @@ def create_sub(
         # Build issue kwargs
         issue_kwargs = {"title": title, "body": body_with_parent}
 
-        if labels:
-            issue_kwargs["labels"] = [l.strip() for l in labels.split(",")]
+        if label_list:
+            issue_kwargs["labels"] = label_list
 
-        if assignees:
-            issue_kwargs["assignees"] = [a.strip().lstrip("@") for a in assignees.split(",")]
+        if assignee_list:
+            issue_kwargs["assignees"] = assignee_list
 
         issue = api.issues.create(**issue_kwargs)
         issue_number = issue.get("number")
@@ -320,25 +445,12 @@ def create_sub(
 
         # Try to create formal sub-issue relationship via GraphQL
         try:
-            # Get node IDs
-            parent_data = api.issues.get(parent)
-            parent_node_id = parent_data.get("node_id")
+            # Get parent node ID (the child's comes back from the create call)
+            (parent_node_id,) = get_issue_node_ids(api, owner, repo_name, parent)
             child_node_id = issue.get("node_id")
 
             if parent_node_id and child_node_id:
-                # Use gh CLI for GraphQL mutation
-                query = f"""
-                    mutation {{
-                        addSubIssue(input: {{issueId: "{parent_node_id}", subIssueId: "{child_node_id}"}}) {{
-                            issue {{ number }}
-                        }}
-                    }}
-                """
-                subprocess.run(
-                    ["gh", "api", "graphql", "-f", f"query={query}"],
-                    check=True,
-                    capture_output=True,
-                )
+                graphql(api, ADD_SUB_ISSUE_MUTATION, parentId=parent_node_id, childId=child_node_id)
                 console.print("[dim]Created formal sub-issue link[/dim]")
         except Exception:
             console.print("[yellow]Note: Could not create formal sub-issue link (may require GitHub Enterprise)[/yellow]")
@@ -357,10 +469,13 @@ def view(
     raw: bool = typer.Option(False, "--raw", "-r", help="Output raw JSON"),
 ):
     """View issue details."""
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
     owner, repo_name = parse_repo(repo)
     api = get_api(owner, repo_name)
 
-    issue = api.issues.get(issue_number)
+    issue = cached_issue_get(api, owner, repo_name, issue_number)
 
     if raw:
         print(json.dumps(dict(issue), indent=2, default=str))
@@ -397,10 +512,13 @@ def list_issues(
     raw: bool = typer.Option(False, "--raw", "-r", help="Output raw JSON"),
 ):
     """List issues in a repository."""
+    from ghapi.all import paged
+    from rich.table import Table
+
     owner, repo_name = parse_repo(repo)
     api = get_api(owner, repo_name)
 
-    list_kwargs = {"state": state, "per_page": limit}
+    list_kwargs = {"state": state}
 
     if labels:
         list_kwargs["labels"] = labels
@@ -411,10 +529,13 @@ def list_issues(
     if creator:
         list_kwargs["creator"] = creator
 
-    issues = list(api.issues.list_for_repo(**list_kwargs))
-
-    # Filter out PRs (they come through issues API)
-    issues = [i for i in issues if "pull_request" not in i]
+    # Walk pages lazily and stop once `limit` issues are collected.
+    # PRs come through the issues API too, so they are skipped along the way.
+    pages = paged(api.issues.list_for_repo, per_page=min(limit, 100), **list_kwargs)
+    issues = list(itertools.islice(
+        (i for page in pages for i in page if "pull_request" not in i),
+        limit,
+    ))
 
     if raw:
         print(json.dumps([dict(i) for i in issues], indent=2, default=str))
@@ -431,17 +552,18 @@ def list_issues(
     table.add_column("Assignee", style="yellow")
     table.add_column("Updated", style="dim")
 
-    for issue in issues[:limit]:
-        labels_str = ", ".join(l.get("name", "")[:10] for l in issue.get("labels", [])[:2])
-        assignees = issue.get("assignees", [])
-        assignee_str = assignees[0].get("login", "") if assignees else ""
+    add_row = table.add_row
+    for issue in issues:
+        labels_str = ", ".join(_get_name(l)[:10] for l in (issue.get("labels") or ())[:2])
+        assignees = issue.get("assignees")
+        updated_at = issue.get("updated_at")
 
-        table.add_row(
+        add_row(
             str(issue.get("number", "")),
             issue.get("title", "")[:50],
             labels_str[:20],
-            assignee_str[:15],
-            issue.get("updated_at", "")[:10] if issue.get("updated_at") else "",
+            _get_login(assignees[0])[:15] if assignees else "",
+            updated_at[:10] if updated_at else "",
         )
 
     console.print(table)
@@ -458,39 +580,17 @@ def link(
     api = get_api(owner, repo_name)
 
     try:
-        # Get node IDs for both issues
-        parent_issue = api.issues.get(parent)
-        child_issue = api.issues.get(child)
-
-        parent_node_id = parent_issue.get("node_id")
-        child_node_id = child_issue.get("node_id")
+        # Get node IDs for both issues in one GraphQL round-trip
+        parent_node_id, child_node_id = get_issue_node_ids(api, owner, repo_name, parent, child)
 
         if not parent_node_id or not child_node_id:
             console.print("[red]Error: Could not get issue node IDs[/red]")
             raise typer.Exit(1)
 
-        # Use gh CLI for GraphQL mutation
-        query = """
-            mutation($parentId: ID!, $childId: ID!) {
-                addSubIssue(input: {issueId: $parentId, subIssueId: $childId}) {
-                    issue { number }
-                }
-            }
-        """
-        result = subprocess.run(
-            [
-                "gh", "api", "graphql",
-                "-f", f"parentId={parent_node_id}",
-                "-f", f"childId={child_node_id}",
-                "-f", f"query={query}",
-            ],
-            capture_output=True,
-            text=True,
-        )
-
-        if result.returncode == 0:
+        try:
+            graphql(api, ADD_SUB_ISSUE_MUTATION, parentId=parent_node_id, childId=child_node_id)
             console.print(f"[green]Linked issue #{child} as sub-issue of #{parent}[/green]")
-        else:
+        except Exception:
             # Fall back to adding a comment reference
             console.print("[yellow]Note: Formal sub-issue linking may require GitHub Enterprise[/yellow]")
             console.print("[dim]Adding reference comment instead...[/dim]")
@@ -521,6 +621,7 @@ def close(
 
         # Close the issue
         api.issues.update(issue_number, state="closed", state_reason=reason)
+        invalidate_issue_cache(owner, repo_name, issue_number)
         console.print(f"[green]Issue #{issue_number} closed ({reason})[/green]")
 
     except Exception as e:
@@ -540,6 +641,7 @@ def comment(
 
     try:
         result = api.issues.create_comment(issue_number, body=body)
+        invalidate_issue_cache(owner, repo_name, issue_number)
         console.print(f"[green]Comment added to issue #{issue_number}[/green]")
         console.print(f"[dim]Comment ID: {result.get('id')}[/dim]")
 
@@ -563,6 +665,7 @@ def labels(
         if add:
             label_list = [l.strip() for l in add.split(",")]
             api.issues.add_labels(issue_number, labels=label_list)
+            invalidate_issue_cache(owner, repo_name, issue_number)
             console.print(f"[green]Added labels: {', '.join(label_list)}[/green]")
 
         if remove:
@@ -572,11 +675,12 @@ def labels(
                     api.issues.remove_label(issue_number, label)
                 except Exception:
                     pass  # Label may not exist
+            invalidate_issue_cache(owner, repo_name, issue_number)
             console.print(f"[green]Removed labels: {', '.join(label_list)}[/green]")
 
         if not add and not remove:
             # List current labels
-            issue = api.issues.get(issue_number)
+            issue = cached_issue_get(api, owner, repo_name, issue_number)
             labels = issue.get("labels", [])
             if labels:
                 console.print("[bold]Current labels:[/bold]")
@@ -590,14 +694,8 @@ def labels(
         raise typer.Exit(1)
 
 
-@app.command()
-def init(
-    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file path"),
-    template: str = typer.Option("default", "--template", "-t", help="Template: default, bug, feature"),
-):
-    """Initialize an issue body file with the Why/What/How template."""
-    templates = {
-        "default": """## Why
+_TEMPLATES: dict[str, str] = {
+    "default": """## Why
 
 Currently, [describe current state/behavior].
 
@@ -635,7 +733,7 @@ Key areas:
 - [ ] [How to manually verify the change]
 - [ ] [Key integration scenario to test]
 """,
-        "bug": """## Bug Description
+    "bug": """## Bug Description
 
 **Current behavior**: [What happens now]
 
@@ -661,7 +759,7 @@ Key areas:
 - [ ] Bug no longer reproduces with steps above
 - [ ] No regression in related functionality
 """,
-        "feature": """## Why
+    "feature": """## Why
 
 [Background and motivation for this feature]
 
@@ -697,13 +795,21 @@ Key components:
 - [ ] [Manual verification steps]
 - [ ] [Integration test scenario]
 """,
-    }
+}
+
+
+@app.command()
+def init(
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file path"),
+    template: str = typer.Option("default", "--template", "-t", help="Template: default, bug, feature"),
+):
+    """Initialize an issue body file with the Why/What/How template."""
 
-    if template not in templates:
-        console.print(f"[red]Error: Unknown template '{template}'. Available: {', '.join(templates.keys())}[/red]")
+    if template not in _TEMPLATES:
+        console.print(f"[red]Error: Unknown template '{template}'. Available: {', '.join(_TEMPLATES.keys())}[/red]")
         raise typer.Exit(1)
 
-    content = templates[template]
+    content = _TEMPLATES[template]
 
     if output is None:
         output = Path("/tmp/issue-body.md")
@@ -5,6 +5,7 @@
 #   "ghapi>=1.0.5",
 #   "typer>=0.9.0",
 #   "rich>=13.0.0",
+#   "orjson>=3.9.0",
 # ]
 # ///
 """
@@ -32,24 +33,68 @@ Examples:
     uv run gh_pr.py resolve owner/repo 123 --comment-id 456
 """
 
-import json
+import copy
+import itertools
 import os
+import random
+import re
+import shutil
+import sqlite3
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache, partial
+from urllib.error import HTTPError
 from urllib.parse import urlparse
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, TypeVar
 
+import orjson
 import typer
-from ghapi.all import GhApi
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.markdown import Markdown
+
+# ghapi and the heavier rich renderables are imported where they are used,
+# so `--help` and argument errors start without loading them.
+if TYPE_CHECKING:
+    from ghapi.all import GhApi
 
 app = typer.Typer(help="GitHub PR Author CLI")
 console = Console()
 
+T = TypeVar("T")
+
+# Statuses GitHub uses for (secondary) rate limits and transient failures
+RETRYABLE_STATUSES = {403, 429, 502, 503}
+# Rate-limit statuses mean GitHub rejected the request unprocessed; a gateway error can arrive
+# after a write went through, so non-idempotent writes (create, merge) only retry these
+RATE_LIMIT_STATUSES = {403, 429}
+MAX_RETRY_DELAY = 60  # seconds; longer waits (e.g. an hourly reset) fail fast instead
+
+# Review comments starting with these prefixes are non-blocking (`comments --actionable`)
+NON_BLOCKING_PATTERN = re.compile(r"\s*(?:nit|optional|fyi|consider):", re.IGNORECASE)
+
+# `extensions.refStorage` in a git config; anything but "files" means HEAD can't be read directly
+REF_STORAGE_PATTERN = re.compile(r"^\s*refstorage\s*=\s*(\S+)", re.IGNORECASE | re.MULTILINE)
+
+# Rendering for `checks`; completed runs are iconified by their conclusion
+FAILED_CONCLUSIONS = frozenset({"failure", "cancelled"})
+CHECK_COMPLETED_ICONS = {"success": "✓", "failure": "✗", "cancelled": "✗"}
+CHECK_STATUS_ICONS = {"in_progress": "⋯", "queued": "○"}
+CHECK_CONCLUSION_LABELS = {
+    "success": "[green]success[/green]",
+    "failure": "[red]failure[/red]",
+    "cancelled": "[yellow]cancelled[/yellow]",
+    "skipped": "[dim]skipped[/dim]",
+}
+
+# ETag-keyed response cache for conditional GETs (GitHub doesn't count 304s against the rate limit)
+# (shared with the pr-review script's gh_pr.py, which uses the same layout)
+CACHE_PATH = Path.home() / ".cache" / "gh_pr" / "cache.sqlite"
+CACHE_MAX_ENTRIES = 1000  # older entries are evicted when the cache is opened
+
 
 def parse_repo(repo: str) -> tuple[str, str]:
     """Parse owner/repo string into tuple."""
@@ -60,22 +105,215 @@ def parse_repo(repo: str) -> tuple[str, str]:
     return parts[0], parts[1]
 
 
-def get_api(owner: str, repo: str) -> GhApi:
-    """Create GhApi instance with token from environment or gh CLI."""
+@lru_cache(maxsize=1)
+def _resolve_token() -> str:
+    """Resolve the GitHub token from environment or gh CLI, once per process."""
     token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
     if not token:
         try:
+            # An absolute executable path and close_fds=False let subprocess use
+            # posix_spawn instead of fork, which avoids copying this process's
+            # page tables just to run `gh`.
+            gh = shutil.which("gh")
+            if gh is None:
+                raise FileNotFoundError("gh")
             result = subprocess.run(
-                ["gh", "auth", "token"],
+                [gh, "auth", "token"],
                 capture_output=True,
                 text=True,
                 check=True,
+                close_fds=False,
             )
             token = result.stdout.strip()
-        except subprocess.CalledProcessError:
+        except (OSError, subprocess.CalledProcessError):
             console.print("[red]Error: No GitHub token found. Set GITHUB_TOKEN or run 'gh auth login'[/red]")
             raise typer.Exit(1)
-    return GhApi(owner=owner, repo=repo, token=token)
+    return token
+
+
+@lru_cache(maxsize=8)
+def get_api(owner: str, repo: str) -> "GhApi":
+    """Create GhApi instance with token from environment or gh CLI (cached per repo)."""
+    from ghapi.all import GhApi
+
+    return GhApi(owner=owner, repo=repo, token=_resolve_token())
+
+
+def graphql(api: "GhApi", query: str, **variables) -> dict:
+    """Run a GraphQL query on the API session and return its data payload."""
+    result = api("/graphql", "POST", data={"query": query, "variables": variables})
+    if result.get("errors"):
+        raise RuntimeError("; ".join(e.get("message", "") for e in result["errors"]))
+    return result.get("data") or {}
+
+
+def _json_default(obj: object) -> object:
+    # ghapi wraps JSON arrays in fastcore L objects, which orjson can't serialize
+    if isinstance(obj, Iterable):
+        return list(obj)
+    return str(obj)
+
+
+def print_json(data: object) -> None:
+    """Write data to stdout as indented JSON, encoded straight to bytes by orjson.
+
+    Lists are streamed item by item, so the full document is never held in memory.
+    """
+    out = sys.stdout.buffer
+    if not isinstance(data, list):
+        out.write(orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2))
+        out.write(b"\n")
+        return
+
+    out.write(b"[")
+    for i, item in enumerate(data):
+        out.write(b",\n  " if i else b"\n  ")
+        # Re-indent the item one level; JSON strings never contain raw newlines
+        out.write(orjson.dumps(item, default=_json_default, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  "))
+    out.write(b"\n]\n" if data else b"]\n")
+
+
+# The cache connection is shared by worker threads, so every access holds this lock
+_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _cache_db() -> Optional[sqlite3.Connection]:
+    """Open the response cache, or return None if it can't be used."""
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(CACHE_PATH, check_same_thread=False)
+        with db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, etag TEXT, body BLOB, link TEXT)"
+            )
+            if "link" not in {row[1] for row in db.execute("PRAGMA table_info(responses)")}:
+                db.execute("ALTER TABLE responses ADD COLUMN link TEXT")
+            # INSERT OR REPLACE gives a rewritten row a new rowid, so the lowest rowids are the stalest
+            db.execute(
+                "DELETE FROM responses WHERE rowid <= "
+                "(SELECT rowid FROM responses ORDER BY rowid DESC LIMIT 1 OFFSET ?)",
+                (CACHE_MAX_ENTRIES,),
+            )
+        return db
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def _cache_lookup(key: str) -> Optional[tuple[str, bytes, Optional[str]]]:
+    """Return the cached (etag, body, Link header) for a request key, if any."""
+    db = _cache_db()
+    if db is None:
+        return None
+    try:
+        with _cache_lock:
+            return db.execute("SELECT etag, body, link FROM responses WHERE key = ?", (key,)).fetchone()
+    except sqlite3.Error:
+        return None
+
+
+def _cache_store(key: str, etag: str, data: object, link: str = "") -> None:
+    """Store a response body under its request key, with its ETag and Link header."""
+    db = _cache_db()
+    if db is None:
+        return
+    try:
+        with _cache_lock, db:
+            db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, etag, orjson.dumps(data, default=_json_default), link),
+            )
+    except sqlite3.Error:
+        pass
+
+
+def _private_op(op: Callable[..., T]) -> Callable[..., T]:
+    """Bind a ghapi endpoint to its own copy of the client.
+
+    ghapi keeps the last response's headers on the client, so requests made
+    from worker threads would otherwise read each other's ETag headers.
+    """
+    private = copy.copy(op)
+    private.client = copy.copy(op.client)
+    return private
+
+
+def cached_get(op: Callable[..., T], *args, **kwargs) -> T:
+    """Call a ghapi GET endpoint, revalidating any cached response with If-None-Match.
+
+    A 304 reuses the cached body; anything else is stored with its new ETag.
+    """
+    op = _private_op(op)
+    key = f"{op.path} {args} {sorted(kwargs.items())}"
+    cached = _cache_lookup(key)
+    try:
+        data = op(*args, headers={"If-None-Match": cached[0]} if cached else None, **kwargs)
+    except HTTPError as e:
+        if e.code != 304 or not cached:
+            raise
+        return orjson.loads(cached[1])
+
+    etag = op.client.recv_hdrs.get("ETag")
+    if etag:
+        _cache_store(key, etag, data, op.client.recv_hdrs.get("Link", ""))
+    return data
+
+
+def retry_delay(error: HTTPError, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying a failed request, or None if it shouldn't be retried."""
+    headers = error.headers or {}
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None and retry_after.isdigit():
+        return float(retry_after)
+    if error.code == 403:
+        # A plain 403 is a permission error; only retry when the rate limit is exhausted
+        if headers.get("X-RateLimit-Remaining") != "0":
+            return None
+        reset = headers.get("X-RateLimit-Reset")
+        if reset is not None and reset.isdigit():
+            return max(float(reset) - time.time(), 0) + 1
+    return 2 ** attempt + random.random()
+
+
+def retry_request(
+    call: Callable[..., T],
+    *args,
+    retries: int = 5,
+    retry_statuses: set[int] = RETRYABLE_STATUSES,
+    **kwargs,
+) -> T:
+    """Call a write endpoint, backing off on rate limits and transient server errors."""
+    for attempt in range(retries):
+        try:
+            return call(*args, **kwargs)
+        except HTTPError as e:
+            if e.code not in retry_statuses:
+                raise
+            delay = retry_delay(e, attempt)
+            if delay is None or delay > MAX_RETRY_DELAY:
+                raise
+            console.print(f"[yellow]GitHub returned {e.code}, retrying in {delay:.0f}s...[/yellow]")
+            time.sleep(delay)
+    return call(*args, **kwargs)
+
+
+def run_concurrently(*calls: Callable[[], object]) -> list[Optional[Exception]]:
+    """Run independent blocking API calls in parallel threads.
+
+    Returns the exception raised by each call (None on success), in call order.
+    """
+    if not calls:
+        return []
+    if len(calls) == 1:
+        # Nothing to overlap; skip the thread pool
+        try:
+            calls[0]()
+        except Exception as e:
+            return [e]
+        return [None]
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = [executor.submit(call) for call in calls]
+    return [f.exception() for f in futures]
 
 
 def extract_pull_number_from_url(url: Optional[str]) -> Optional[int]:
@@ -94,7 +332,7 @@ def extract_pull_number_from_url(url: Optional[str]) -> Optional[int]:
     return None
 
 
-def get_pull_number_from_comment(api: GhApi, comment_id: int) -> int:
+def get_pull_number_from_comment(api: "GhApi", comment_id: int) -> int:
     """Fetch PR number for a given review comment."""
     try:
         comment = api.pulls.get_review_comment(comment_id)
@@ -111,13 +349,19 @@ def get_pull_number_from_comment(api: GhApi, comment_id: int) -> int:
 
 
 def find_review_thread_id(
-    api: GhApi,
+    api: "GhApi",
     owner: str,
     repo: str,
     pr_number: int,
     comment_id: int,
 ) -> tuple[Optional[str], Optional[bool]]:
-    """Find the GraphQL review thread ID for a given review comment database ID."""
+    """Find the GraphQL review thread ID for a given review comment database ID.
+
+    GraphQL has no comment -> thread edge, so threads are scanned by their root
+    comment only. Most lookups name a root comment and are answered by the scan
+    alone; for a reply, the root is looked up through the REST comment's
+    in_reply_to_id and matched against the threads already fetched.
+    """
     query = """
     query($owner: String!, $repo: String!, $number: Int!, $after: String) {
       repository(owner: $owner, name: $repo) {
@@ -126,7 +370,7 @@ def find_review_thread_id(
             nodes {
               id
               isResolved
-              comments(first: 50) {
+              comments(first: 1) {
                 nodes {
                   databaseId
                 }
@@ -142,35 +386,254 @@ def find_review_thread_id(
     }
     """
 
+    threads_by_root: dict[int, tuple[Optional[str], Optional[bool]]] = {}
     after: Optional[str] = None
     while True:
-        data = api.graphql(query, owner=owner, repo=repo, number=pr_number, after=after)
-        threads = (
+        data = graphql(api, query, owner=owner, repo=repo, number=pr_number, after=after)
+        review_threads = (
             data.get("repository", {})
             .get("pullRequest", {})
             .get("reviewThreads", {})
-            .get("nodes", [])
         )
-        for thread in threads:
-            comments = thread.get("comments", {}).get("nodes", [])
-            for comment in comments:
-                if comment.get("databaseId") == comment_id:
-                    return thread.get("id"), thread.get("isResolved")
-        page_info = (
+        for thread in review_threads.get("nodes", []):
+            roots = thread.get("comments", {}).get("nodes", [])
+            if not roots:
+                continue
+            if roots[0].get("databaseId") == comment_id:
+                return thread.get("id"), thread.get("isResolved")
+            threads_by_root[roots[0].get("databaseId")] = (thread.get("id"), thread.get("isResolved"))
+        page_info = review_threads.get("pageInfo", {})
+        if not page_info.get("hasNextPage"):
+            break
+        after = page_info.get("endCursor")
+
+    # Not a root comment: map the reply to its root
+    try:
+        root_id = api.pulls.get_review_comment(comment_id).get("in_reply_to_id")
+    except Exception:
+        root_id = None
+    return threads_by_root.get(root_id, (None, None))
+
+
+def iter_check_runs(api: "GhApi", head_sha: str, per_page: int = 100):
+    """Yield check runs for a commit, fetching each page only when it is reached."""
+    page = 1
+    while True:
+        data = cached_get(api.checks.list_for_ref, head_sha, per_page=per_page, page=page)
+        runs = data.get("check_runs", [])
+        yield from runs
+        if len(runs) < per_page or page * per_page >= data.get("total_count", 0):
+            return
+        page += 1
+
+
+# Comment fields shared by the thread listing and the follow-up pages of long threads
+REVIEW_COMMENT_FIELDS = """
+fragment commentFields on PullRequestReviewComment {
+  id
+  databaseId
+  path
+  line
+  originalLine
+  body
+  url
+  createdAt
+  author {
+    login
+  }
+  replyTo {
+    databaseId
+  }
+}
+"""
+
+REVIEW_THREADS_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!, $after: String) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      reviewThreads(first: 100, after: $after) {
+        nodes {
+          id
+          comments(first: 100) {
+            nodes { ...commentFields }
+            pageInfo { hasNextPage endCursor }
+          }
+        }
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
+      }
+    }
+  }
+}
+""" + REVIEW_COMMENT_FIELDS
+
+# Later comments of a thread with more than 100 of them
+THREAD_COMMENTS_QUERY = """
+query($id: ID!, $after: String) {
+  node(id: $id) {
+    ... on PullRequestReviewThread {
+      comments(first: 100, after: $after) {
+        nodes { ...commentFields }
+        pageInfo { hasNextPage endCursor }
+      }
+    }
+  }
+}
+""" + REVIEW_COMMENT_FIELDS
+
+
+def iter_thread_comments(api: "GhApi", thread: dict):
+    """Yield every comment node of a review thread, fetching pages past the first 100."""
+    comments = thread.get("comments") or {}
+    while True:
+        yield from comments.get("nodes", [])
+        page_info = comments.get("pageInfo") or {}
+        if not page_info.get("hasNextPage"):
+            return
+        data = graphql(api, THREAD_COMMENTS_QUERY, id=thread.get("id"), after=page_info.get("endCursor"))
+        comments = (data.get("node") or {}).get("comments") or {}
+
+
+def fetch_review_comments(api: "GhApi", owner: str, repo: str, pr_number: int):
+    """Yield all review comments on a PR via GraphQL, in the REST field names the commands use.
+
+    Comments come grouped by review thread, 100 threads (and 100 comments per
+    thread) per request, instead of REST's default 30 comments per page. Only
+    the fields the comment views need are included; `comments --raw` uses
+    iter_rest_review_comments for the full REST objects.
+    """
+    after: Optional[str] = None
+    while True:
+        data = graphql(api, REVIEW_THREADS_QUERY, owner=owner, repo=repo, number=pr_number, after=after)
+        review_threads = (
             data.get("repository", {})
             .get("pullRequest", {})
             .get("reviewThreads", {})
-            .get("pageInfo", {})
         )
+        for thread in review_threads.get("nodes", []):
+            for comment in iter_thread_comments(api, thread):
+                yield {
+                    "id": comment.get("databaseId"),
+                    "node_id": comment.get("id"),
+                    "path": comment.get("path"),
+                    "line": comment.get("line"),
+                    "original_line": comment.get("originalLine"),
+                    "body": comment.get("body", ""),
+                    "html_url": comment.get("url"),
+                    "created_at": comment.get("createdAt"),
+                    "user": {"login": (comment.get("author") or {}).get("login", "unknown")},
+                    "in_reply_to_id": (comment.get("replyTo") or {}).get("databaseId"),
+                }
+        page_info = review_threads.get("pageInfo", {})
         if not page_info.get("hasNextPage"):
             break
         after = page_info.get("endCursor")
 
-    return None, None
+
+def iter_rest_review_comments(api: "GhApi", pr_number: int, per_page: int = 100):
+    """Yield a PR's review comments as full REST objects, in creation order."""
+    page = 1
+    while True:
+        comments = cached_get(api.pulls.list_review_comments, pr_number, per_page=per_page, page=page)
+        yield from comments
+        if len(comments) < per_page:
+            return
+        page += 1
+
+
+def search_prs_by_author(api: "GhApi", owner: str, repo: str, author: str, state: str, limit: int):
+    """Yield up to `limit` PRs by `author` via GraphQL search, shaped like REST pull objects."""
+    query = """
+    query($q: String!, $first: Int!, $after: String) {
+      search(query: $q, type: ISSUE, first: $first, after: $after) {
+        nodes {
+          ... on PullRequest {
+            number
+            title
+            url
+            state
+            updatedAt
+            headRefName
+            author {
+              login
+            }
+          }
+        }
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
+      }
+    }
+    """
+    qualifiers = [f"repo:{owner}/{repo}", "is:pr", f"author:{author}", "sort:created-desc"]
+    if state in ("open", "closed"):
+        qualifiers.append(f"is:{state}")
+    search_query = " ".join(qualifiers)
+
+    after: Optional[str] = None
+    remaining = limit
+    while remaining > 0:
+        data = graphql(api, query, q=search_query, first=min(remaining, 100), after=after)
+        search = data.get("search", {})
+        nodes = search.get("nodes", [])
+        for pr in nodes[:remaining]:
+            yield {
+                "number": pr.get("number"),
+                "title": pr.get("title", ""),
+                "html_url": pr.get("url"),
+                # REST reports merged PRs as closed
+                "state": "open" if pr.get("state") == "OPEN" else "closed",
+                "updated_at": pr.get("updatedAt"),
+                "user": {"login": (pr.get("author") or {}).get("login", "unknown")},
+                "head": {"ref": pr.get("headRefName", "")},
+            }
+        remaining -= len(nodes)
+        page_info = search.get("pageInfo", {})
+        if not nodes or not page_info.get("hasNextPage"):
+            break
+        after = page_info.get("endCursor")
+
+
+def _read_head_branch() -> Optional[str]:
+    """Read the checked-out branch from the nearest .git/HEAD, or None if that isn't possible."""
+    if "GIT_DIR" in os.environ:
+        return None
+    cwd = Path.cwd()
+    for parent in (cwd, *cwd.parents):
+        git_path = parent / ".git"
+        try:
+            if git_path.is_file():
+                # Worktrees and submodules point at their real git dir
+                gitdir = git_path.read_text().strip().removeprefix("gitdir: ")
+                git_path = parent / gitdir
+            elif not git_path.is_dir():
+                continue
+            head = (git_path / "HEAD").read_text().strip()
+            # Worktrees keep the shared config in the main git dir
+            commondir = git_path / "commondir"
+            config_dir = git_path / commondir.read_text().strip() if commondir.is_file() else git_path
+            config = (config_dir / "config").read_text()
+        except OSError:
+            return None
+        # Under the reftable backend HEAD is only a `refs/heads/.invalid` stub
+        ref_storage = REF_STORAGE_PATTERN.search(config)
+        if ref_storage and ref_storage.group(1).lower() != "files":
+            return None
+        # A detached HEAD holds a commit SHA instead of a ref
+        branch = head.removeprefix("ref: refs/heads/") if head.startswith("ref: refs/heads/") else None
+        return None if branch == ".invalid" else branch
+    return None
 
 
 def get_current_branch() -> str:
     """Get the current git branch name."""
+    # Reading HEAD directly avoids spawning git for the common case
+    branch = _read_head_branch()
+    if branch:
+        return branch
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--abbrev-ref", "HEAD"],
@@ -179,10 +642,32 @@ def get_current_branch() -> str:
             check=True,
         )
         return result.stdout.strip()
-    except subprocess.CalledProcessError:
+    except (OSError, subprocess.CalledProcessError):
         return ""
 
 
+def set_labels_and_assignees(
+    api: "GhApi", pr_number: int, labels: Optional[list[str]] = None, assignees: Optional[list[str]] = None
+) -> None:
+    """Set a new PR's labels and assignees, in a single issue update when possible.
+
+    The combined update is rejected (422) as a whole if any assignee can't be
+    assigned, which would lose the labels too. In that case the labels are set
+    alone and the assignees added through add_assignees, which skips invalid
+    logins, as separate calls did before.
+    """
+    # Unset fields are left out: ghapi would send them as null
+    fields = {name: value for name, value in (("labels", labels), ("assignees", assignees)) if value}
+    try:
+        retry_request(api.issues.update, pr_number, **fields)
+    except HTTPError as e:
+        if e.code != 422 or not assignees:
+            raise
+        if labels:
+            retry_request(api.issues.update, pr_number, labels=labels)
+        retry_request(api.issues.add_assignees, pr_number, assignees=assignees)
+
+
 @app.command()
 def create(
     repo: str = typer.Argument(..., help="Repository in owner/repo format"),
@@ -215,7 +700,9 @@ def create(
             raise typer.Exit(1)
 
     try:
-        pr = api.pulls.create(
+        pr = retry_request(
+            api.pulls.create,
+            retry_statuses=RATE_LIMIT_STATUSES,
             title=title,
             body=body,
             head=head,
@@ -227,23 +714,37 @@ def create(
         console.print(f"[green]PR #{pr_number} created successfully![/green]")
         console.print(f"[dim]URL: {pr.get('html_url')}[/dim]")
 
-        # Add labels if specified
+        # Labels and assignees go out in a single issue update (the PR is new, so
+        # setting them replaces nothing); reviewers need their own endpoint and
+        # are requested concurrently.
+        followups: list[tuple[str, Callable[[], object]]] = []
+        update_fields: dict[str, list[str]] = {}
+        update_messages: list[str] = []
         if labels:
-            label_list = [l.strip() for l in labels.split(",")]
-            api.issues.add_labels(pr_number, labels=label_list)
-            console.print(f"[dim]Added labels: {', '.join(label_list)}[/dim]")
-
-        # Add reviewers if specified
+            update_fields["labels"] = [l.strip() for l in labels.split(",")]
+            update_messages.append(f"Added labels: {', '.join(update_fields['labels'])}")
+        if assignees:
+            update_fields["assignees"] = [a.strip().lstrip("@") for a in assignees.split(",")]
+            update_messages.append(f"Added assignees: {', '.join(update_fields['assignees'])}")
+        if update_fields:
+            followups.append((
+                "\n".join(update_messages),
+                partial(set_labels_and_assignees, api, pr_number, **update_fields),
+            ))
         if reviewers:
             reviewer_list = [r.strip() for r in reviewers.split(",")]
-            api.pulls.request_reviewers(pr_number, reviewers=reviewer_list)
-            console.print(f"[dim]Requested reviewers: {', '.join(reviewer_list)}[/dim]")
-
-        # Add assignees if specified
-        if assignees:
-            assignee_list = [a.strip().lstrip("@") for a in assignees.split(",")]
-            api.issues.add_assignees(pr_number, assignees=assignee_list)
-            console.print(f"[dim]Added assignees: {', '.join(assignee_list)}[/dim]")
+            followups.append((
+                f"Requested reviewers: {', '.join(reviewer_list)}",
+                partial(retry_request, api.pulls.request_reviewers, pr_number, reviewers=reviewer_list),
+            ))
+
+        errors = run_concurrently(*(call for _, call in followups))
+        for (done_message, _), error in zip(followups, errors):
+            if error is None:
+                console.print(f"[dim]{done_message}[/dim]")
+        first_error = next((e for e in errors if e is not None), None)
+        if first_error is not None:
+            raise first_error
 
         print(pr.get("html_url"))
 
@@ -252,6 +753,33 @@ def create(
         raise typer.Exit(1)
 
 
+VIEW_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      title
+      state
+      merged
+      body
+      headRefName
+      baseRefName
+      author {
+        login
+      }
+      reviews(first: 100) {
+        nodes {
+          state
+          author {
+            login
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
 @app.command()
 def view(
     repo: str = typer.Argument(..., help="Repository in owner/repo format"),
@@ -259,24 +787,31 @@ def view(
     raw: bool = typer.Option(False, "--raw", "-r", help="Output raw JSON"),
 ):
     """View PR details."""
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
     owner, repo_name = parse_repo(repo)
     api = get_api(owner, repo_name)
 
-    pr = api.pulls.get(pr_number)
-
     if raw:
-        print(json.dumps(dict(pr), indent=2, default=str))
+        pr = cached_get(api.pulls.get, pr_number)
+        print_json(pr)
         return
 
-    state = pr.get("state", "unknown")
-    state_color = "green" if state == "open" else "red" if state == "closed" else "yellow"
+    # PR metadata and reviews in a single round-trip
+    data = graphql(api, VIEW_QUERY, owner=owner, repo=repo_name, number=pr_number)
+    pr = (data.get("repository") or {}).get("pullRequest") or {}
+
+    # GraphQL reports merged PRs as state MERGED; REST reports them as closed + merged
     merged = pr.get("merged", False)
+    state = "closed" if merged else (pr.get("state") or "unknown").lower()
+    state_color = "green" if state == "open" else "red" if state == "closed" else "yellow"
 
     console.print(Panel(
         f"[bold]{pr.get('title', '')}[/bold]\n\n"
         f"[{state_color}]{state.upper()}{'  MERGED' if merged else ''}[/{state_color}]\n\n"
-        f"[dim]#{pr_number} opened by {pr.get('user', {}).get('login', 'unknown')}[/dim]\n"
-        f"[dim]{pr.get('head', {}).get('ref', '')} → {pr.get('base', {}).get('ref', '')}[/dim]",
+        f"[dim]#{pr_number} opened by {(pr.get('author') or {}).get('login', 'unknown')}[/dim]\n"
+        f"[dim]{pr.get('headRefName', '')} → {pr.get('baseRefName', '')}[/dim]",
         title=f"PR #{pr_number}",
     ))
 
@@ -285,13 +820,13 @@ def view(
         console.print(Markdown(pr.get("body", "")))
 
     # Show review status
-    reviews = list(api.pulls.list_reviews(pr_number))
+    reviews = (pr.get("reviews") or {}).get("nodes") or []
     if reviews:
         console.print("\n[bold]Reviews:[/bold]")
         for review in reviews:
             state = review.get("state", "PENDING")
             icon = {"APPROVED": "✓", "CHANGES_REQUESTED": "✗", "COMMENTED": "💬"}.get(state, "○")
-            console.print(f"  {icon} {review.get('user', {}).get('login', 'unknown')}: {state}")
+            console.print(f"  {icon} {(review.get('author') or {}).get('login', 'unknown')}: {state}")
 
 
 @app.command(name="list")
@@ -303,16 +838,27 @@ def list_prs(
     raw: bool = typer.Option(False, "--raw", "-r", help="Output raw JSON"),
 ):
     """List PRs in a repository."""
+    from ghapi.all import paged
+    from rich.table import Table
+    from rich.text import Text
+
     owner, repo_name = parse_repo(repo)
     api = get_api(owner, repo_name)
 
-    prs = list(api.pulls.list(state=state, per_page=limit))
-
     if author:
-        prs = [p for p in prs if p.get("user", {}).get("login", "").lower() == author.lower()]
+        # Filter server-side instead of fetching every PR and discarding most of them
+        prs = list(search_prs_by_author(api, owner, repo_name, author, state, limit))
+        if raw and prs:
+            # The search only returns the fields the table shows; --raw hydrates full REST objects
+            with ThreadPoolExecutor(max_workers=min(len(prs), 8)) as executor:
+                prs = list(executor.map(lambda pr: cached_get(api.pulls.get, pr["number"]), prs))
+    else:
+        # Walk pages lazily and stop once `limit` PRs are collected
+        pages = paged(partial(cached_get, api.pulls.list), state=state, per_page=min(limit, 100))
+        prs = list(itertools.islice((pr for page in pages for pr in page), limit))
 
     if raw:
-        print(json.dumps([dict(p) for p in prs], indent=2, default=str))
+        print_json(prs)
         return
 
     table = Table(title=f"Pull Requests ({state})")
@@ -322,14 +868,20 @@ def list_prs(
     table.add_column("Branch", style="yellow")
     table.add_column("Updated", style="dim")
 
-    for pr in prs[:limit]:
-        table.add_row(
-            str(pr.get("number", "")),
-            pr.get("title", "")[:50],
-            pr.get("user", {}).get("login", "unknown"),
-            pr.get("head", {}).get("ref", "")[:20],
-            pr.get("updated_at", "")[:10] if pr.get("updated_at") else "",
+    # Cells are pre-truncated plain Text, so Rich skips markup parsing per cell
+    # (and titles like "[WIP] ..." render literally)
+    rows = [
+        (
+            Text(str(pr.get("number", ""))),
+            Text(pr.get("title", "")[:50]),
+            Text(pr.get("user", {}).get("login", "unknown")),
+            Text(pr.get("head", {}).get("ref", "")[:20]),
+            Text((pr.get("updated_at") or "")[:10]),
         )
+        for pr in prs
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -341,27 +893,24 @@ def checks(
     raw: bool = typer.Option(False, "--raw", "-r", help="Output raw JSON"),
 ):
     """Get PR check status."""
+    from rich.table import Table
+
     owner, repo_name = parse_repo(repo)
     api = get_api(owner, repo_name)
 
     # Get the head SHA
-    pr = api.pulls.get(pr_number)
+    pr = cached_get(api.pulls.get, pr_number)
     head_sha = pr.get("head", {}).get("sha", "")
 
     if not head_sha:
         console.print("[red]Error: Could not get PR head commit[/red]")
         raise typer.Exit(1)
 
-    # Get check runs for the commit
-    checks_data = api.checks.list_for_ref(head_sha)
-    check_runs = checks_data.get("check_runs", [])
+    # Get check runs for the commit (pages are fetched as the loop consumes them)
+    check_runs = iter_check_runs(api, head_sha)
 
     if raw:
-        print(json.dumps([dict(c) for c in check_runs], indent=2, default=str))
-        return
-
-    if not check_runs:
-        console.print("[yellow]No checks found for this PR[/yellow]")
+        print_json(list(check_runs))
         return
 
     table = Table(title=f"PR #{pr_number} Checks")
@@ -369,27 +918,36 @@ def checks(
     table.add_column("Name", style="cyan")
     table.add_column("Conclusion", style="green")
 
+    first_failure = None
     for check in check_runs:
         status = check.get("status", "unknown")
         conclusion = check.get("conclusion", "pending")
 
-        status_icon = {
-            "completed": "✓" if conclusion == "success" else "✗" if conclusion in ["failure", "cancelled"] else "○",
-            "in_progress": "⋯",
-            "queued": "○",
-        }.get(status, "?")
-
-        conclusion_color = {
-            "success": "[green]success[/green]",
-            "failure": "[red]failure[/red]",
-            "cancelled": "[yellow]cancelled[/yellow]",
-            "skipped": "[dim]skipped[/dim]",
-        }.get(conclusion, conclusion or "[dim]pending[/dim]")
+        if status == "completed":
+            status_icon = CHECK_COMPLETED_ICONS.get(conclusion, "○")
+        else:
+            status_icon = CHECK_STATUS_ICONS.get(status, "?")
+        conclusion_color = CHECK_CONCLUSION_LABELS.get(conclusion, conclusion or "[dim]pending[/dim]")
 
         table.add_row(status_icon, check.get("name", ""), conclusion_color)
 
+        # The overall result can't get any better, so skip the remaining checks
+        if conclusion in FAILED_CONCLUSIONS:
+            first_failure = check
+            break
+
+    if not table.row_count:
+        console.print("[yellow]No checks found for this PR[/yellow]")
+        return
+
     console.print(table)
 
+    if first_failure is not None:
+        console.print(
+            f"[red]Checks failing: {first_failure.get('name', '')} {first_failure.get('conclusion')}"
+            " (stopped at first failure)[/red]"
+        )
+
 
 @app.command()
 def comments(
@@ -403,18 +961,18 @@ def comments(
     owner, repo_name = parse_repo(repo)
     api = get_api(owner, repo_name)
 
-    comments_data = list(api.pulls.list_review_comments(pr_number))
+    if raw:
+        # Raw output keeps the full REST payload (diff_hunk, commit_id, side, ...) in creation order
+        comments_data = list(iter_rest_review_comments(api, pr_number))
+    else:
+        comments_data = list(fetch_review_comments(api, owner, repo_name, pr_number))
 
     if actionable:
         # Filter out non-blocking comments
-        non_blocking_prefixes = ["nit:", "optional:", "fyi:", "consider:"]
-        comments_data = [
-            c for c in comments_data
-            if not any(c.get("body", "").lower().strip().startswith(p) for p in non_blocking_prefixes)
-        ]
+        comments_data = [c for c in comments_data if not NON_BLOCKING_PATTERN.match(c.get("body", ""))]
 
     if raw:
-        print(json.dumps([dict(c) for c in comments_data], indent=2, default=str))
+        print_json(comments_data)
         return
 
     if not comments_data:
@@ -512,7 +1070,7 @@ def resolve(
     """
 
     try:
-        result = api.graphql(mutation, threadId=thread_id)
+        result = graphql(api, mutation, threadId=thread_id)
         payload = result.get(mutation_name, {})
         thread = payload.get("thread", {})
         console.print(
@@ -560,27 +1118,29 @@ def merge(
         raise typer.Exit(1)
 
     try:
-        # Get PR info first
-        pr = api.pulls.get(pr_number)
-        head_ref = pr.get("head", {}).get("ref", "")
-
         # Merge the PR
         merge_kwargs = {"merge_method": method}
         if message:
             merge_kwargs["commit_message"] = message
 
-        result = api.pulls.merge(pr_number, **merge_kwargs)
+        # The head branch name is only needed for deletion, so look it up while merging
+        with ThreadPoolExecutor(max_workers=1) if delete_branch else nullcontext() as executor:
+            pr_future = executor.submit(api.pulls.get, pr_number) if executor else None
+            result = retry_request(api.pulls.merge, pr_number, retry_statuses=RATE_LIMIT_STATUSES, **merge_kwargs)
 
         if result.get("merged"):
             console.print(f"[green]PR #{pr_number} merged successfully![/green]")
 
-            # Delete branch if requested
-            if delete_branch and head_ref:
+            # Delete branch if requested; the PR is merged by now, so failures here are only warnings
+            if pr_future is not None:
+                head_ref = ""
                 try:
-                    api.git.delete_ref(f"heads/{head_ref}")
-                    console.print(f"[dim]Deleted branch: {head_ref}[/dim]")
+                    head_ref = pr_future.result().get("head", {}).get("ref", "")
+                    if head_ref:
+                        retry_request(api.git.delete_ref, f"heads/{head_ref}")
+                        console.print(f"[dim]Deleted branch: {head_ref}[/dim]")
                 except Exception:
-                    console.print(f"[yellow]Could not delete branch: {head_ref}[/yellow]")
+                    console.print(f"[yellow]Could not delete branch: {head_ref or 'unknown'}[/yellow]")
         else:
             console.print(f"[yellow]PR was not merged: {result.get('message', 'unknown reason')}[/yellow]")
 
@@ -589,6 +1149,24 @@ def merge(
         raise typer.Exit(1)
 
 
+REVIEW_REQUESTS_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      reviewRequests(first: 100) {
+        nodes {
+          requestedReviewer {
+            ... on User { login }
+            ... on Team { slug }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
 @app.command()
 def reviewers(
     repo: str = typer.Argument(..., help="Repository in owner/repo format"),
@@ -600,30 +1178,39 @@ def reviewers(
     owner, repo_name = parse_repo(repo)
     api = get_api(owner, repo_name)
 
+    # Adding and removing touch different reviewers, so run both requests concurrently
+    actions: list[tuple[str, str, Callable[[], object]]] = []
     if add:
         reviewer_list = [r.strip() for r in add.split(",")]
-        try:
-            api.pulls.request_reviewers(pr_number, reviewers=reviewer_list)
-            console.print(f"[green]Added reviewers: {', '.join(reviewer_list)}[/green]")
-        except Exception as e:
-            console.print(f"[red]Error adding reviewers: {e}[/red]")
-
+        actions.append((
+            f"Added reviewers: {', '.join(reviewer_list)}",
+            "Error adding reviewers",
+            partial(retry_request, api.pulls.request_reviewers, pr_number, reviewers=reviewer_list),
+        ))
     if remove:
         reviewer_list = [r.strip() for r in remove.split(",")]
-        try:
-            api.pulls.remove_requested_reviewers(pr_number, reviewers=reviewer_list)
-            console.print(f"[green]Removed reviewers: {', '.join(reviewer_list)}[/green]")
-        except Exception as e:
-            console.print(f"[red]Error removing reviewers: {e}[/red]")
+        actions.append((
+            f"Removed reviewers: {', '.join(reviewer_list)}",
+            "Error removing reviewers",
+            partial(retry_request, api.pulls.remove_requested_reviewers, pr_number, reviewers=reviewer_list),
+        ))
+
+    errors = run_concurrently(*(call for _, _, call in actions))
+    for (done_message, error_prefix, _), error in zip(actions, errors):
+        if error is None:
+            console.print(f"[green]{done_message}[/green]")
+        else:
+            console.print(f"[red]{error_prefix}: {error}[/red]")
 
     if not add and not remove:
-        # List current reviewers
-        pr = api.pulls.get(pr_number)
-        requested = pr.get("requested_reviewers", [])
+        # List current reviewers, fetching only the review requests instead of the whole PR
+        data = graphql(api, REVIEW_REQUESTS_QUERY, owner=owner, repo=repo_name, number=pr_number)
+        pr = (data.get("repository") or {}).get("pullRequest") or {}
+        requested = [n.get("requestedReviewer") or {} for n in pr.get("reviewRequests", {}).get("nodes", [])]
         if requested:
             console.print("[bold]Requested reviewers:[/bold]")
             for r in requested:
-                console.print(f"  - {r.get('login', 'unknown')}")
+                console.print(f"  - {r.get('login') or r.get('slug') or 'unknown'}")
         else:
             console.print("[yellow]No reviewers requested[/yellow]")
 
@@ -641,7 +1228,7 @@ def issue(
     issue_data = api.issues.get(issue_number)
 
     if raw:
-        print(json.dumps(dict(issue_data), indent=2, default=str))
+        print_json(issue_data)
         return
 
     state = issue_data.get("state", "unknown")
@@ -5,6 +5,8 @@
 #   "ghapi>=1.0.5",
 #   "typer>=0.9.0",
 #   "rich>=13.0.0",
+#   "orjson>=3.9.0",
+#   "msgspec>=0.18.0",
 # ]
 # ///
 """
@@ -21,32 +23,94 @@ Commands:
     reply       Reply to a specific review comment
     resolve     Resolve or unresolve a review thread
     head        Get the head commit SHA for a PR
+    batch       Get head, files, reviews and comments as one JSON document
     checkout    Create a worktree and checkout the PR branch
     cleanup     Remove a PR worktree
 
 Examples:
     uv run gh_pr.py files owner/repo 123
     uv run gh_pr.py comments owner/repo 123 --unresolved
+    uv run gh_pr.py batch owner/repo 123
     uv run gh_pr.py post owner/repo 123 /tmp/pr-review.json
     uv run gh_pr.py resolve owner/repo 123 --comment-id 456
     uv run gh_pr.py checkout owner/repo 123
 """
 
-import json
+import copy
 import os
+import random
+import re
+import shutil
+import sqlite3
 import subprocess
 import sys
-from urllib.parse import urlparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Iterable, Literal, Optional, TypeVar
+from urllib.error import HTTPError
 
+import msgspec
+import orjson
 import typer
-from ghapi.all import GhApi
 from rich.console import Console
-from rich.table import Table
+from rich.markup import escape
+
+# ghapi and the rich table renderables are imported where they are used,
+# so `--help`, `cleanup` and argument errors start without loading them.
+if TYPE_CHECKING:
+    from ghapi.all import GhApi
 
 app = typer.Typer(help="GitHub PR Review CLI")
 console = Console()
+# Diagnostics go to stderr so they never interleave with --raw JSON on stdout
+err_console = Console(stderr=True)
+
+T = TypeVar("T")
+
+# PR number in an API URL: the segment after /pulls/, else the last numeric segment
+PULL_NUMBER_PATTERN = re.compile(r"/pulls/(\d+)(?=[/?#]|$)")
+LAST_NUMBER_PATTERN = re.compile(r"[^?#]*/(\d+)(?=[/?#]|$)")
+
+# Page number of the rel="last" entry in a REST Link header
+LAST_PAGE_PATTERN = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+# Checked in order before falling back to `gh auth token`
+TOKEN_ENV_VARS = ("GITHUB_TOKEN", "GH_TOKEN")
+
+# Values the create-review API accepts, enforced when `post` decodes a review file
+ReviewEvent = Literal["APPROVE", "REQUEST_CHANGES", "COMMENT"]
+DiffSide = Literal["LEFT", "RIGHT"]
+
+# Statuses GitHub uses for (secondary) rate limits and transient failures
+RETRYABLE_STATUSES = {403, 429, 502, 503, 504}
+MAX_RETRY_DELAY = 60  # seconds; longer waits (e.g. an hourly reset) fail fast instead
+
+REST_PAGE_SIZE = 100
+
+CACHE_DIR = Path.home() / ".cache" / "gh_pr"
+
+# ETag-keyed response cache for conditional GETs (GitHub doesn't count 304s against the rate limit)
+# (shared with the pr-creator script's gh_pr.py, which uses the same layout)
+CACHE_PATH = CACHE_DIR / "cache.sqlite"
+CACHE_MAX_ENTRIES = 1000  # older entries are evicted when the cache is opened
+
+# Token from `gh auth token`, reused by later invocations for up to an hour
+TOKEN_CACHE_PATH = CACHE_DIR / "token"
+TOKEN_CACHE_TTL = 3600  # seconds
+
+
+@app.callback()
+def main(
+    refresh_token: bool = typer.Option(
+        False, "--refresh-token", help="Ignore the cached gh CLI token and fetch a fresh one"
+    ),
+):
+    """GitHub PR Review CLI"""
+    if refresh_token:
+        TOKEN_CACHE_PATH.unlink(missing_ok=True)
 
 
 def parse_repo(repo: str) -> tuple[str, str]:
@@ -58,45 +122,341 @@ def parse_repo(repo: str) -> tuple[str, str]:
     return parts[0], parts[1]
 
 
-def get_api(owner: str, repo: str) -> GhApi:
-    """Create GhApi instance with token from environment or gh CLI."""
-    token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+@lru_cache(maxsize=1)
+def _resolve_token() -> str:
+    """Resolve the GitHub token from environment or gh CLI, once per process."""
+    token = next((os.environ[name] for name in TOKEN_ENV_VARS if os.environ.get(name)), None)
+    if token:
+        return token
+
+    token = _read_cached_token()
     if not token:
-        # Try to get token from gh CLI
+        # Try to get token from gh CLI (spawned like git, see run_git)
         try:
+            gh = shutil.which("gh")
+            if gh is None:
+                raise FileNotFoundError("gh")
             result = subprocess.run(
-                ["gh", "auth", "token"],
+                [gh, "auth", "token"],
                 capture_output=True,
                 text=True,
                 check=True,
+                close_fds=False,
             )
             token = result.stdout.strip()
-        except subprocess.CalledProcessError:
+        except (OSError, subprocess.CalledProcessError):
             console.print("[red]Error: No GitHub token found. Set GITHUB_TOKEN or run 'gh auth login'[/red]")
             raise typer.Exit(1)
-    return GhApi(owner=owner, repo=repo, token=token)
+        _write_cached_token(token)
+    return token
+
+
+def _read_cached_token() -> Optional[str]:
+    """Return the cached gh CLI token if it is younger than TOKEN_CACHE_TTL."""
+    try:
+        if time.time() - TOKEN_CACHE_PATH.stat().st_mtime < TOKEN_CACHE_TTL:
+            return TOKEN_CACHE_PATH.read_text().strip() or None
+    except OSError:
+        pass
+    return None
+
+
+def _write_cached_token(token: str) -> None:
+    """Cache a gh CLI token in a file only the current user can read."""
+    try:
+        TOKEN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(TOKEN_CACHE_PATH, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            os.fchmod(f.fileno(), 0o600)
+            f.write(token)
+    except OSError:
+        pass
+
+
+# Serializes token renewal when several worker threads get a 401 at once
+_token_lock = threading.Lock()
+
+
+def _renew_cached_token(client: "GhApi") -> bool:
+    """Swap a rejected token for a fresh one from gh, if it came from the on-disk cache.
+
+    Covers `gh auth switch`, logout or revocation within TOKEN_CACHE_TTL. Returns
+    False when there is nothing newer to try, so the caller should give up.
+    """
+    with _token_lock:
+        stale = client.headers.get("Authorization", "").removeprefix("token ")
+        if _resolve_token() == stale:
+            if _read_cached_token() != stale:
+                return False
+            TOKEN_CACHE_PATH.unlink(missing_ok=True)
+            _resolve_token.cache_clear()
+            if _resolve_token() == stale:
+                return False
+        client.headers["Authorization"] = f"token {_resolve_token()}"
+        return True
+
+
+def call_api(call: Callable[..., T], *args, **kwargs) -> T:
+    """Call an endpoint, renewing a stale cached gh token once if GitHub answers 401.
+
+    A 401 means the request was not processed, so repeating it is safe even for writes.
+    """
+    try:
+        return call(*args, **kwargs)
+    except HTTPError as e:
+        if e.code != 401 or not _renew_cached_token(getattr(call, "client", call)):
+            raise
+    return call(*args, **kwargs)
+
+
+@lru_cache(maxsize=8)
+def get_api(owner: str, repo: str) -> "GhApi":
+    """Create GhApi instance with token from environment or gh CLI (cached per repo)."""
+    from ghapi.all import GhApi
+
+    return GhApi(owner=owner, repo=repo, token=_resolve_token())
+
+
+def retry_delay(error: HTTPError, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying a failed request, or None if it shouldn't be retried."""
+    headers = error.headers or {}
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None and retry_after.isdigit():
+        return float(retry_after)
+    if error.code == 403:
+        # A plain 403 is a permission error; only retry when the rate limit is exhausted
+        if headers.get("X-RateLimit-Remaining") != "0":
+            return None
+        reset = headers.get("X-RateLimit-Reset")
+        if reset is not None and reset.isdigit():
+            return max(float(reset) - time.time(), 0) + 1
+    return 2 ** attempt + random.random()
+
+
+def retry_request(call: Callable[..., T], *args, retries: int = 3, **kwargs) -> T:
+    """Call an endpoint, backing off on rate limits and transient server errors."""
+    for attempt in range(retries):
+        try:
+            return call_api(call, *args, **kwargs)
+        except HTTPError as e:
+            if e.code not in RETRYABLE_STATUSES:
+                raise
+            delay = retry_delay(e, attempt)
+            if delay is None or delay > MAX_RETRY_DELAY:
+                raise
+            err_console.print(f"[yellow]GitHub returned {e.code}, retrying in {delay:.0f}s...[/yellow]")
+            time.sleep(delay)
+    return call_api(call, *args, **kwargs)
+
+
+# The cache connection is shared by worker threads, so every access holds this lock
+_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _cache_db() -> Optional[sqlite3.Connection]:
+    """Open the response cache, or return None if it can't be used."""
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(CACHE_PATH, check_same_thread=False)
+        with db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, etag TEXT, body BLOB, link TEXT)"
+            )
+            if "link" not in {row[1] for row in db.execute("PRAGMA table_info(responses)")}:
+                db.execute("ALTER TABLE responses ADD COLUMN link TEXT")
+            # INSERT OR REPLACE gives a rewritten row a new rowid, so the lowest rowids are the stalest
+            db.execute(
+                "DELETE FROM responses WHERE rowid <= "
+                "(SELECT rowid FROM responses ORDER BY rowid DESC LIMIT 1 OFFSET ?)",
+                (CACHE_MAX_ENTRIES,),
+            )
+        return db
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def _cache_lookup(key: str) -> Optional[tuple[str, bytes, Optional[str]]]:
+    """Return the cached (etag, body, Link header) for a request key, if any."""
+    db = _cache_db()
+    if db is None:
+        return None
+    try:
+        with _cache_lock:
+            return db.execute("SELECT etag, body, link FROM responses WHERE key = ?", (key,)).fetchone()
+    except sqlite3.Error:
+        return None
+
+
+def _cache_store(key: str, etag: str, data: object, link: str = "") -> None:
+    """Store a response body under its request key, with its ETag and Link header."""
+    db = _cache_db()
+    if db is None:
+        return
+    try:
+        with _cache_lock, db:
+            db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, etag, orjson.dumps(data, default=_json_default), link),
+            )
+    except sqlite3.Error:
+        pass
+
+
+def _private_op(op: Callable[..., T]) -> Callable[..., T]:
+    """Bind a ghapi endpoint to its own copy of the client.
+
+    ghapi keeps the last response's headers on the client, so requests made
+    from worker threads would otherwise read each other's ETag and Link headers.
+    """
+    private = copy.copy(op)
+    private.client = copy.copy(op.client)
+    return private
+
+
+def cached_fetch(op: Callable[..., T], *args, **kwargs) -> tuple[T, Optional[str]]:
+    """Call a ghapi GET endpoint, revalidating any cached response with If-None-Match.
+
+    A 304 reuses the cached body, so repeated reads skip the download (and
+    GitHub doesn't count them against the rate limit). Returns the data and
+    the response's Link header ("" if it had none), which is cached with the
+    body; None means a cached body predates that and its Link is unknown.
+    """
+    op = _private_op(op)
+    key = f"{op.path} {args} {sorted(kwargs.items())}"
+    cached = _cache_lookup(key)
+    headers = {"If-None-Match": cached[0]} if cached else None
+    try:
+        data = retry_request(op, *args, headers=headers, **kwargs)
+    except HTTPError as e:
+        if e.code != 304 or not cached:
+            raise
+        return orjson.loads(cached[1]), cached[2]
+
+    link = op.client.recv_hdrs.get("Link", "")
+    etag = op.client.recv_hdrs.get("ETag")
+    if etag:
+        _cache_store(key, etag, data, link)
+    return data, link
+
+
+def cached_get(op: Callable[..., T], *args, **kwargs) -> T:
+    """Like cached_fetch, for callers that only need the data."""
+    return cached_fetch(op, *args, **kwargs)[0]
+
+
+def _json_default(obj: object) -> object:
+    # ghapi wraps JSON arrays in fastcore L objects, which orjson can't serialize
+    if isinstance(obj, Iterable):
+        return list(obj)
+    return str(obj)
+
+
+def print_json(data: object) -> None:
+    """Write data to stdout as indented JSON, encoded straight to bytes by orjson.
+
+    Lists and other iterables are streamed item by item as they are produced,
+    so the full document is never built up in memory.
+    """
+    out = sys.stdout.buffer
+    if isinstance(data, (dict, str)) or not isinstance(data, Iterable):
+        out.write(orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2))
+        out.write(b"\n")
+        return
+
+    out.write(b"[")
+    empty = True
+    for item in data:
+        out.write(b"\n  " if empty else b",\n  ")
+        # Re-indent the item one level; JSON strings never contain raw newlines
+        out.write(orjson.dumps(item, default=_json_default, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  "))
+        empty = False
+    out.write(b"]\n" if empty else b"\n]\n")
+
+
+def iter_all_pages(op: Callable[..., list], *args) -> Iterable:
+    """Yield every item of a ghapi REST list endpoint, pages after the first fetched in parallel.
+
+    Items are yielded page by page as soon as each page (in order) has arrived,
+    so callers can stream them out without holding the whole listing.
+    """
+    first, link = cached_fetch(op, *args, per_page=REST_PAGE_SIZE)
+    yield from first
+    if len(first) < REST_PAGE_SIZE:
+        return
+
+    if link is not None:
+        match = LAST_PAGE_PATTERN.search(link)
+        n_pages = int(match.group(1)) if match else 1
+    else:
+        # No Link header on record: a one-item page's `last` link gives the item count
+        probe = _private_op(op)
+        retry_request(probe, *args, per_page=1)
+        n_pages = -(-probe.client.last_page() // REST_PAGE_SIZE)
+    if n_pages <= 1:
+        return
+    fetch_page = partial(cached_get, op, *args, per_page=REST_PAGE_SIZE)
+    with ThreadPoolExecutor(max_workers=min(n_pages - 1, 8)) as executor:
+        for page in executor.map(lambda page: fetch_page(page=page), range(2, n_pages + 1)):
+            yield from page
+
+
+def graphql(api: "GhApi", query: str, **variables) -> dict:
+    """Run a GraphQL query on the API session and return its data payload."""
+    result = retry_request(api, "/graphql", "POST", data={"query": query, "variables": variables})
+    if result.get("errors"):
+        raise RuntimeError("; ".join(e.get("message", "") for e in result["errors"]))
+    return result.get("data") or {}
+
+
+def iter_pr_connection(
+    api: "GhApi",
+    owner: str,
+    repo: str,
+    pr_number: int,
+    query: str,
+    field: str,
+    after: Optional[str] = None,
+):
+    """Yield every node of a paginated pullRequest connection, 100 per request.
+
+    `query` must take $owner, $repo, $number and $after, and select
+    `nodes` and `pageInfo { hasNextPage endCursor }` on pullRequest.<field>.
+    Pass `after` to resume from a page that was already fetched elsewhere.
+    """
+    while True:
+        data = graphql(api, query, owner=owner, repo=repo, number=pr_number, after=after)
+        connection = (data.get("repository") or {}).get("pullRequest", {}).get(field, {})
+        yield from connection.get("nodes", [])
+        page_info = connection.get("pageInfo", {})
+        if not page_info.get("hasNextPage"):
+            return
+        after = page_info.get("endCursor")
+
+
+def pr_connection_nodes(
+    api: "GhApi", owner: str, repo: str, pr_number: int, pr: dict, query: str, field: str
+):
+    """Yield the nodes of a connection already fetched on `pr`, then any later pages via `query`."""
+    connection = pr.get(field) or {}
+    yield from connection.get("nodes", [])
+    page_info = connection.get("pageInfo", {})
+    if page_info.get("hasNextPage"):
+        yield from iter_pr_connection(api, owner, repo, pr_number, query, field, after=page_info.get("endCursor"))
 
 
 def extract_pull_number_from_url(url: Optional[str]) -> Optional[int]:
     """Extract PR number from a GitHub pull request API URL."""
     if not url:
         return None
-    path = urlparse(url).path
-    parts = [part for part in path.split("/") if part]
-    if "pulls" in parts:
-        idx = parts.index("pulls")
-        if idx + 1 < len(parts) and parts[idx + 1].isdigit():
-            return int(parts[idx + 1])
-    for part in reversed(parts):
-        if part.isdigit():
-            return int(part)
-    return None
+    match = PULL_NUMBER_PATTERN.search(url) or LAST_NUMBER_PATTERN.match(url)
+    return int(match.group(1)) if match else None
 
 
-def get_pull_number_from_comment(api: GhApi, comment_id: int) -> int:
+def get_pull_number_from_comment(api: "GhApi", comment_id: int) -> int:
     """Fetch PR number for a given review comment."""
     try:
-        comment = api.pulls.get_review_comment(comment_id)
+        comment = cached_get(api.pulls.get_review_comment, comment_id)
     except Exception as e:
         console.print(f"[red]Error fetching review comment {comment_id}: {e}[/red]")
         raise typer.Exit(1)
@@ -110,62 +470,352 @@ def get_pull_number_from_comment(api: GhApi, comment_id: int) -> int:
 
 
 def find_review_thread_id(
-    api: GhApi,
+    api: "GhApi",
     owner: str,
     repo: str,
     pr_number: int,
     comment_id: int,
 ) -> tuple[Optional[str], Optional[bool]]:
-    """Find the GraphQL review thread ID for a given review comment database ID."""
-    query = """
-    query($owner: String!, $repo: String!, $number: Int!, $after: String) {
-      repository(owner: $owner, name: $repo) {
-        pullRequest(number: $number) {
-          reviewThreads(first: 100, after: $after) {
-            nodes {
-              id
-              isResolved
-              comments(first: 50) {
-                nodes {
-                  databaseId
-                }
-              }
-            }
-            pageInfo {
-              hasNextPage
-              endCursor
-            }
-          }
+    """Find the GraphQL review thread ID for a given review comment database ID.
+
+    GraphQL has no comment -> thread edge, so threads are scanned by their root
+    comment only. Most lookups name a root comment and are answered by the scan
+    alone; for a reply, the root is looked up through the REST comment's
+    in_reply_to_id and matched against the threads already fetched.
+    """
+    # Stops requesting pages as soon as the comment's thread is found
+    threads_by_root: dict[int, tuple[Optional[str], Optional[bool]]] = {}
+    for thread in iter_pr_connection(api, owner, repo, pr_number, THREAD_ROOTS_QUERY, "reviewThreads"):
+        roots = thread.get("comments", {}).get("nodes", [])
+        if not roots:
+            continue
+        if roots[0].get("databaseId") == comment_id:
+            return thread.get("id"), thread.get("isResolved")
+        threads_by_root[roots[0].get("databaseId")] = (thread.get("id"), thread.get("isResolved"))
+
+    # Not a root comment: map the reply to its root
+    try:
+        root_id = cached_get(api.pulls.get_review_comment, comment_id).get("in_reply_to_id")
+    except Exception:
+        root_id = None
+    return threads_by_root.get(root_id, (None, None))
+
+
+# Node selections shared by the per-command queries and `batch`
+FILE_FIELDS = """
+fragment fileFields on PullRequestChangedFile { path additions deletions changeType }
+"""
+
+REVIEW_FIELDS = """
+fragment reviewFields on PullRequestReview {
+  databaseId
+  state
+  submittedAt
+  author { login }
+}
+"""
+
+COMMENT_FIELDS = """
+fragment commentFields on PullRequestReviewComment {
+  id
+  databaseId
+  path
+  line
+  originalLine
+  body
+  url
+  createdAt
+  author { login }
+  replyTo { databaseId }
+  pullRequestReview { databaseId state }
+}
+"""
+
+THREAD_FIELDS = """
+fragment threadFields on PullRequestReviewThread {
+  id
+  isResolved
+  comments(first: 100) {
+    nodes { ...commentFields }
+    pageInfo { hasNextPage endCursor }
+  }
+}
+""" + COMMENT_FIELDS
+
+FILES_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!, $after: String) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      files(first: 100, after: $after) {
+        nodes { ...fileFields }
+        pageInfo { hasNextPage endCursor }
+      }
+    }
+  }
+}
+""" + FILE_FIELDS
+
+# GraphQL change types, spelled as the REST `status` field
+FILE_STATUSES = {
+    "ADDED": "added",
+    "DELETED": "removed",
+    "MODIFIED": "modified",
+    "RENAMED": "renamed",
+    "COPIED": "copied",
+    "CHANGED": "changed",
+}
+
+# Colors for the `issue` state line; other states render yellow
+ISSUE_STATE_COLORS = {"open": "green", "closed": "red"}
+
+# Styles for the `reviews` State column; unknown states render unstyled
+REVIEW_STATE_STYLES = {
+    "APPROVED": "green",
+    "CHANGES_REQUESTED": "red",
+    "COMMENTED": "yellow",
+    "PENDING": "dim",
+    "DISMISSED": "dim",
+}
+
+REVIEW_THREADS_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!, $after: String) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      reviewThreads(first: 100, after: $after) {
+        nodes { ...threadFields }
+        pageInfo { hasNextPage endCursor }
+      }
+    }
+  }
+}
+""" + THREAD_FIELDS
+
+# Later comments of a thread with more than 100 of them
+THREAD_COMMENTS_QUERY = """
+query($id: ID!, $after: String) {
+  node(id: $id) {
+    ... on PullRequestReviewThread {
+      comments(first: 100, after: $after) {
+        nodes { ...commentFields }
+        pageInfo { hasNextPage endCursor }
+      }
+    }
+  }
+}
+""" + COMMENT_FIELDS
+
+REVIEWS_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!, $after: String) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      reviews(first: 100, after: $after) {
+        nodes { ...reviewFields }
+        pageInfo { hasNextPage endCursor }
+      }
+    }
+  }
+}
+""" + REVIEW_FIELDS
+
+# Head commit plus the first page of files, for `init-review --full`
+PR_HEAD_AND_FILES_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      headRefOid
+      files(first: 100) {
+        nodes { ...fileFields }
+        pageInfo { hasNextPage endCursor }
+      }
+    }
+  }
+}
+""" + FILE_FIELDS
+
+# First pages of everything `batch` reports, in one request
+BATCH_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      number
+      title
+      body
+      state
+      url
+      baseRefName
+      headRefName
+      headRefOid
+      files(first: 100) {
+        nodes { ...fileFields }
+        pageInfo { hasNextPage endCursor }
+      }
+      reviews(first: 100) {
+        nodes { ...reviewFields }
+        pageInfo { hasNextPage endCursor }
+      }
+      reviewThreads(first: 100) {
+        nodes { ...threadFields }
+        pageInfo { hasNextPage endCursor }
+      }
+    }
+  }
+}
+""" + FILE_FIELDS + REVIEW_FIELDS + THREAD_FIELDS
+
+PR_HEAD_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      headRefName
+      headRefOid
+    }
+  }
+}
+"""
+
+# Threads with only their root comment, for `find_review_thread_id`
+THREAD_ROOTS_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!, $after: String) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      reviewThreads(first: 100, after: $after) {
+        nodes {
+          id
+          isResolved
+          comments(first: 1) { nodes { databaseId } }
         }
+        pageInfo { hasNextPage endCursor }
       }
     }
-    """
+  }
+}
+"""
+
+RESOLVE_THREAD_MUTATION = """
+mutation($threadId: ID!) {
+  resolveReviewThread(input: {threadId: $threadId}) {
+    thread { id isResolved }
+  }
+}
+"""
+
+UNRESOLVE_THREAD_MUTATION = """
+mutation($threadId: ID!) {
+  unresolveReviewThread(input: {threadId: $threadId}) {
+    thread { id isResolved }
+  }
+}
+"""
+
+
+class ReviewComment(msgspec.Struct, omit_defaults=True):
+    """One inline comment of a review file, as accepted by the create-review API."""
+
+    path: str
+    body: str
+    line: Optional[int] = None
+    side: Optional[DiffSide] = None
+    start_line: Optional[int] = None
+    start_side: Optional[DiffSide] = None
+    position: Optional[int] = None
 
-    after: Optional[str] = None
+
+class Review(msgspec.Struct):
+    """A review file as written by `init-review` (extra metadata fields are ignored)."""
+
+    commit_id: str
+    event: ReviewEvent
+    body: str = ""
+    comments: list[ReviewComment] = []
+
+
+def file_summary(node: dict) -> dict:
+    """Shape a GraphQL changed-file node like the REST file listing (without the patch)."""
+    return {
+        "filename": node.get("path"),
+        "status": FILE_STATUSES.get(node.get("changeType"), "unknown"),
+        "additions": node.get("additions", 0),
+        "deletions": node.get("deletions", 0),
+    }
+
+
+def iter_thread_comments(api: "GhApi", thread: dict):
+    """Yield every comment node of a review thread, fetching pages past the first 100."""
+    comments = thread.get("comments") or {}
     while True:
-        data = api.graphql(query, owner=owner, repo=repo, number=pr_number, after=after)
-        threads = (
-            data.get("repository", {})
-            .get("pullRequest", {})
-            .get("reviewThreads", {})
-            .get("nodes", [])
-        )
-        for thread in threads:
-            comments = thread.get("comments", {}).get("nodes", [])
-            for comment in comments:
-                if comment.get("databaseId") == comment_id:
-                    return thread.get("id"), thread.get("isResolved")
-        page_info = (
-            data.get("repository", {})
-            .get("pullRequest", {})
-            .get("reviewThreads", {})
-            .get("pageInfo", {})
-        )
+        yield from comments.get("nodes", [])
+        page_info = comments.get("pageInfo") or {}
         if not page_info.get("hasNextPage"):
-            break
-        after = page_info.get("endCursor")
+            return
+        data = graphql(api, THREAD_COMMENTS_QUERY, id=thread.get("id"), after=page_info.get("endCursor"))
+        comments = (data.get("node") or {}).get("comments") or {}
 
-    return None, None
+
+def thread_comments(api: "GhApi", thread: dict):
+    """Yield a GraphQL review thread's comments, shaped like REST review comments.
+
+    Each comment also carries its thread's `is_resolved` state and its review's
+    `review_state`, which REST doesn't expose.
+    """
+    for comment in iter_thread_comments(api, thread):
+        review = comment.get("pullRequestReview") or {}
+        yield {
+            "id": comment.get("databaseId"),
+            "node_id": comment.get("id"),
+            "path": comment.get("path"),
+            "line": comment.get("line"),
+            "original_line": comment.get("originalLine"),
+            "body": comment.get("body", ""),
+            "html_url": comment.get("url"),
+            "created_at": comment.get("createdAt"),
+            "user": {"login": (comment.get("author") or {}).get("login", "unknown")},
+            "in_reply_to_id": (comment.get("replyTo") or {}).get("databaseId"),
+            "pull_request_review_id": review.get("databaseId"),
+            "review_state": review.get("state"),
+            "is_resolved": thread.get("isResolved", False),
+        }
+
+
+def fetch_review_comments(api: "GhApi", owner: str, repo: str, pr_number: int, unresolved_only: bool = False):
+    """Yield all review comments on a PR via GraphQL (see `thread_comments`).
+
+    With `unresolved_only`, resolved threads are dropped before any of their
+    comments are converted.
+    """
+    for thread in iter_pr_connection(api, owner, repo, pr_number, REVIEW_THREADS_QUERY, "reviewThreads"):
+        if unresolved_only and thread.get("isResolved"):
+            continue
+        yield from thread_comments(api, thread)
+
+
+def get_pr_head(api: "GhApi", owner: str, repo: str, pr_number: int) -> tuple[str, str]:
+    """Return the PR's head (branch name, commit SHA), fetching only those two fields."""
+    data = graphql(api, PR_HEAD_QUERY, owner=owner, repo=repo, number=pr_number)
+    pr = (data.get("repository") or {}).get("pullRequest") or {}
+    return pr.get("headRefName") or "", pr.get("headRefOid") or ""
+
+
+@lru_cache(maxsize=1)
+def _git_executable() -> str:
+    return shutil.which("git") or "git"
+
+
+def run_git(*args: str, check: bool = True, capture_stdout: bool = False) -> subprocess.CompletedProcess:
+    """Run a git command, capturing stderr as text for error messages.
+
+    stdout is discarded unless capture_stdout is set, so git never writes
+    into this script's own output. An absolute executable path and
+    close_fds=False let subprocess use posix_spawn instead of fork, which
+    avoids copying this process's page tables for every git call.
+    """
+    return subprocess.run(
+        [_git_executable(), *args],
+        check=check,
+        stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        close_fds=False,
+    )
 
 
 @app.command()
@@ -178,23 +828,33 @@ def files(
     owner, repo_name = parse_repo(repo)
     api = get_api(owner, repo_name)
 
-    files_data = list(api.pulls.list_files(pr_number))
-
     if raw:
-        print(json.dumps([dict(f) for f in files_data], indent=2))
+        # Raw output keeps the full REST payload, patches included
+        files_data = iter_all_pages(api.pulls.list_files, pr_number)
+        print_json(files_data)
         return
 
+    files_data = iter_pr_connection(api, owner, repo_name, pr_number, FILES_QUERY, "files")
+
+    from rich.table import Table
+    from rich.text import Text
+
     table = Table(title=f"PR #{pr_number} Files")
     table.add_column("Status", style="cyan")
     table.add_column("File", style="green")
     table.add_column("Changes", style="yellow")
 
-    for f in files_data:
-        status = f.get("status", "unknown")
-        filename = f.get("filename", "")
-        additions = f.get("additions", 0)
-        deletions = f.get("deletions", 0)
-        table.add_row(status, filename, f"+{additions}/-{deletions}")
+    # Cells are plain Text, so Rich skips markup parsing (and paths with [brackets] render literally)
+    rows = [
+        (
+            Text(FILE_STATUSES.get(f.get("changeType"), "unknown")),
+            Text(f.get("path", "")),
+            Text(f"+{f.get('additions', 0)}/-{f.get('deletions', 0)}"),
+        )
+        for f in files_data
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -211,36 +871,37 @@ def comments(
     owner, repo_name = parse_repo(repo)
     api = get_api(owner, repo_name)
 
-    comments_data = list(api.pulls.list_review_comments(pr_number))
-
-    # Filter for unresolved comments if requested
-    # Note: GitHub API doesn't directly expose 'resolved' status on comments
-    # We check for in_reply_to_id to identify thread roots and look for resolution
-    if unresolved:
-        # Get all threads and filter those that aren't resolved
-        # This is a simplified heuristic - in practice, resolved status
-        # requires checking the GraphQL API or review threads endpoint
-        thread_roots = [c for c in comments_data if c.get("in_reply_to_id") is None]
-        comments_data = thread_roots
+    # Filters stay lazy, so comments are written (raw or rendered) as their pages arrive
+    comments_data = fetch_review_comments(api, owner, repo_name, pr_number, unresolved_only=unresolved)
 
     if pending:
         # Filter for comments not yet part of a submitted review
-        comments_data = [c for c in comments_data if c.get("pull_request_review_id") is None]
+        comments_data = (c for c in comments_data if c["review_state"] in (None, "PENDING"))
 
     if raw:
-        print(json.dumps([dict(c) for c in comments_data], indent=2))
-        return
-
-    if not comments_data:
-        console.print("[yellow]No comments found matching criteria[/yellow]")
+        # Raw output keeps the full REST payload (diff_hunk, commit_id, side, ...) in creation order;
+        # resolution and review state only exist in GraphQL, so filters select REST comments by ID
+        rest_comments = iter_all_pages(api.pulls.list_review_comments, pr_number)
+        if unresolved or pending:
+            wanted = {c["id"] for c in comments_data}
+            rest_comments = (c for c in rest_comments if c.get("id") in wanted)
+        print_json(rest_comments)
         return
 
+    found = False
     for comment in comments_data:
-        console.print(f"\n[bold cyan]Comment ID:[/bold cyan] {comment.get('id')}")
-        console.print(f"[bold]File:[/bold] {comment.get('path')}:{comment.get('line', comment.get('original_line', '?'))}")
-        console.print(f"[bold]Author:[/bold] {comment.get('user', {}).get('login', 'unknown')}")
-        console.print(f"[dim]{comment.get('body', '')}[/dim]")
-        console.print("-" * 40)
+        found = True
+        # One print (one console lock and write) per comment
+        console.print(
+            f"\n[bold cyan]Comment ID:[/bold cyan] {comment.get('id')}\n"
+            f"[bold]File:[/bold] {comment.get('path')}:{comment.get('line') or comment.get('original_line') or '?'}\n"
+            f"[bold]Author:[/bold] {comment.get('user', {}).get('login', 'unknown')}\n"
+            f"[dim]{escape(comment.get('body', ''))}[/dim]\n"
+            + "-" * 40
+        )
+
+    if not found:
+        console.print("[yellow]No comments found matching criteria[/yellow]")
 
 
 @app.command()
@@ -253,12 +914,18 @@ def reviews(
     owner, repo_name = parse_repo(repo)
     api = get_api(owner, repo_name)
 
-    reviews_data = list(api.pulls.list_reviews(pr_number))
-
     if raw:
-        print(json.dumps([dict(r) for r in reviews_data], indent=2))
+        # Raw output keeps the full REST payload
+        reviews_data = iter_all_pages(api.pulls.list_reviews, pr_number)
+        print_json(reviews_data)
         return
 
+    reviews_data = iter_pr_connection(api, owner, repo_name, pr_number, REVIEWS_QUERY, "reviews")
+
+    from rich.table import Table
+    from rich.text import Text
+
+    # Cells are pre-styled Text, so Rich skips markup parsing per cell
     table = Table(title=f"PR #{pr_number} Reviews")
     table.add_column("ID", style="dim")
     table.add_column("Author", style="cyan")
@@ -267,19 +934,11 @@ def reviews(
 
     for review in reviews_data:
         state = review.get("state", "PENDING")
-        state_color = {
-            "APPROVED": "[green]APPROVED[/green]",
-            "CHANGES_REQUESTED": "[red]CHANGES_REQUESTED[/red]",
-            "COMMENTED": "[yellow]COMMENTED[/yellow]",
-            "PENDING": "[dim]PENDING[/dim]",
-            "DISMISSED": "[dim]DISMISSED[/dim]",
-        }.get(state, state)
-
         table.add_row(
-            str(review.get("id", "")),
-            review.get("user", {}).get("login", "unknown"),
-            state_color,
-            review.get("submitted_at", "")[:10] if review.get("submitted_at") else "pending",
+            Text(str(review.get("databaseId", ""))),
+            Text((review.get("author") or {}).get("login", "unknown")),
+            Text(state, style=REVIEW_STATE_STYLES.get(state, "")),
+            Text((review.get("submittedAt") or "")[:10] or "pending"),
         )
 
     console.print(table)
@@ -311,44 +970,36 @@ def post(
         console.print(f"[red]Error: Review file not found: {review_file}[/red]")
         raise typer.Exit(1)
 
+    # Parsing and validation (required fields, event values, comment shapes) is one pass
     try:
-        review_data = json.loads(review_file.read_text())
-    except json.JSONDecodeError as e:
-        console.print(f"[red]Error: Invalid JSON in review file: {e}[/red]")
-        raise typer.Exit(1)
-
-    # Validate required fields
-    required = ["commit_id", "event"]
-    missing = [f for f in required if f not in review_data]
-    if missing:
-        console.print(f"[red]Error: Missing required fields: {missing}[/red]")
-        raise typer.Exit(1)
-
-    # Validate event type
-    valid_events = ["APPROVE", "REQUEST_CHANGES", "COMMENT"]
-    if review_data["event"] not in valid_events:
-        console.print(f"[red]Error: Invalid event '{review_data['event']}'. Must be one of: {valid_events}[/red]")
+        review = msgspec.json.decode(review_file.read_bytes(), type=Review)
+    except msgspec.DecodeError as e:
+        console.print(f"[red]Error: Invalid review file: {e}[/red]")
         raise typer.Exit(1)
 
     try:
-        result = api.pulls.create_review(
+        result = call_api(
+            api.pulls.create_review,
             pr_number,
-            commit_id=review_data["commit_id"],
-            body=review_data.get("body", ""),
-            event=review_data["event"],
-            comments=review_data.get("comments", []),
+            commit_id=review.commit_id,
+            body=review.body,
+            event=review.event,
+            comments=msgspec.to_builtins(review.comments),
         )
         console.print(f"[green]Review posted successfully! Review ID: {result.get('id')}[/green]")
-
-        # Clean up the review file on success
-        review_file.unlink()
-        console.print(f"[dim]Cleaned up review file: {review_file}[/dim]")
-
     except Exception as e:
         console.print(f"[red]Error posting review: {e}[/red]")
         console.print("[yellow]Review file preserved for retry[/yellow]")
         raise typer.Exit(1)
 
+    # Clean up the review file on success; the review is already posted, so a
+    # failure here must not be reported as a failed post (and invite a re-post)
+    try:
+        review_file.unlink()
+        console.print(f"[dim]Cleaned up review file: {review_file}[/dim]")
+    except OSError as e:
+        console.print(f"[yellow]Review posted, but could not remove {review_file}: {e}[/yellow]")
+
 
 @app.command()
 def reply(
@@ -363,8 +1014,11 @@ def reply(
     try:
         # The ghapi library uses pulls.create_reply_for_review_comment
         pull_number = get_pull_number_from_comment(api, comment_id)
-        result = api.pulls.create_reply_for_review_comment(
-            pull_number=pull_number, comment_id=comment_id, body=body
+        result = call_api(
+            api.pulls.create_reply_for_review_comment,
+            pull_number=pull_number,
+            comment_id=comment_id,
+            body=body,
         )
         console.print(f"[green]Reply posted successfully! Comment ID: {result.get('id')}[/green]")
     except Exception as e:
@@ -403,20 +1057,13 @@ def resolve(
             console.print("[yellow]Thread is already unresolved[/yellow]")
             return
 
-    mutation_name = "unresolveReviewThread" if unresolve else "resolveReviewThread"
-    mutation = f"""
-    mutation($threadId: ID!) {{
-      {mutation_name}(input: {{threadId: $threadId}}) {{
-        thread {{
-          id
-          isResolved
-        }}
-      }}
-    }}
-    """
+    if unresolve:
+        mutation_name, mutation = "unresolveReviewThread", UNRESOLVE_THREAD_MUTATION
+    else:
+        mutation_name, mutation = "resolveReviewThread", RESOLVE_THREAD_MUTATION
 
     try:
-        result = api.graphql(mutation, threadId=thread_id)
+        result = graphql(api, mutation, threadId=thread_id)
         payload = result.get(mutation_name, {})
         thread = payload.get("thread", {})
         console.print(
@@ -437,8 +1084,7 @@ def head(
     owner, repo_name = parse_repo(repo)
     api = get_api(owner, repo_name)
 
-    pr = api.pulls.get(pr_number)
-    sha = pr.get("head", {}).get("sha", "")
+    _, sha = get_pr_head(api, owner, repo_name, pr_number)
 
     if sha:
         print(sha)
@@ -458,8 +1104,7 @@ def checkout(
     api = get_api(owner, repo_name)
 
     # Get PR info
-    pr = api.pulls.get(pr_number)
-    branch = pr.get("head", {}).get("ref", "")
+    branch, head_sha = get_pr_head(api, owner, repo_name, pr_number)
 
     if not branch:
         console.print("[red]Error: Could not get PR branch name[/red]")
@@ -477,26 +1122,22 @@ def checkout(
         return
 
     try:
-        # Fetch the PR branch
-        subprocess.run(
-            ["git", "fetch", "origin", f"pull/{pr_number}/head:{branch}"],
-            check=True,
-            capture_output=True,
+        # Fetch the PR branch, unless the local branch is already at the PR head
+        local = run_git(
+            "rev-parse", "--verify", "--quiet", f"refs/heads/{branch}", check=False, capture_stdout=True
         )
+        if local.returncode != 0 or local.stdout.strip() != head_sha:
+            run_git("fetch", "--no-tags", "origin", f"pull/{pr_number}/head:{branch}")
 
         # Create worktree
-        subprocess.run(
-            ["git", "worktree", "add", str(worktree_path), branch],
-            check=True,
-            capture_output=True,
-        )
+        run_git("worktree", "add", str(worktree_path), branch)
 
         console.print(f"[green]Created worktree at: {worktree_path}[/green]")
         console.print(f"[dim]Branch: {branch}[/dim]")
         print(str(worktree_path))
 
     except subprocess.CalledProcessError as e:
-        console.print(f"[red]Error creating worktree: {e.stderr.decode() if e.stderr else e}[/red]")
+        console.print(f"[red]Error creating worktree: {e.stderr.strip() if e.stderr else e}[/red]")
         raise typer.Exit(1)
 
 
@@ -519,31 +1160,101 @@ def cleanup(
         return
 
     try:
-        subprocess.run(
-            ["git", "worktree", "remove", str(worktree_path), "--force"],
-            check=True,
-            capture_output=True,
-        )
+        run_git("worktree", "remove", str(worktree_path), "--force")
         console.print(f"[green]Removed worktree: {worktree_path}[/green]")
 
     except subprocess.CalledProcessError as e:
-        console.print(f"[red]Error removing worktree: {e.stderr.decode() if e.stderr else e}[/red]")
+        console.print(f"[red]Error removing worktree: {e.stderr.strip() if e.stderr else e}[/red]")
         raise typer.Exit(1)
 
 
+@app.command()
+def batch(
+    repo: str = typer.Argument(..., help="Repository in owner/repo format"),
+    pr_number: int = typer.Argument(..., help="Pull request number"),
+):
+    """Print the PR's head, files, reviews and review comments as one JSON document.
+
+    Everything comes from a single GraphQL request (plus follow-up pages on
+    PRs with more than 100 files, reviews or threads), so it replaces separate
+    `head`, `files`, `reviews` and `comments --raw` calls.
+    """
+    owner, repo_name = parse_repo(repo)
+    api = get_api(owner, repo_name)
+
+    # A missing repo or PR comes back as a GraphQL error rather than a null node
+    try:
+        data = graphql(api, BATCH_QUERY, owner=owner, repo=repo_name, number=pr_number)
+    except RuntimeError as e:
+        err_console.print(f"[red]Error fetching PR #{pr_number}: {escape(str(e))}[/red]")
+        raise typer.Exit(1)
+    pr = (data.get("repository") or {}).get("pullRequest") or {}
+
+    # Most PRs fit in the first pages; the connections that don't are independent,
+    # so their follow-up pages are fetched concurrently
+    connections = {"files": FILES_QUERY, "reviews": REVIEWS_QUERY, "reviewThreads": REVIEW_THREADS_QUERY}
+    nodes = {field: (pr.get(field) or {}).get("nodes", []) for field in connections}
+    paged_fields = [
+        field for field in connections if ((pr.get(field) or {}).get("pageInfo") or {}).get("hasNextPage")
+    ]
+    if paged_fields:
+        with ThreadPoolExecutor(max_workers=len(paged_fields)) as executor:
+            futures = {
+                field: executor.submit(
+                    list, pr_connection_nodes(api, owner, repo_name, pr_number, pr, connections[field], field)
+                )
+                for field in paged_fields
+            }
+        nodes.update((field, future.result()) for field, future in futures.items())
+
+    print_json({
+        "number": pr.get("number"),
+        "title": pr.get("title"),
+        "body": pr.get("body"),
+        "state": pr.get("state"),
+        "html_url": pr.get("url"),
+        "base_ref": pr.get("baseRefName"),
+        "head_ref": pr.get("headRefName"),
+        "head_sha": pr.get("headRefOid"),
+        "files": [file_summary(f) for f in nodes["files"]],
+        "reviews": [
+            {
+                "id": r.get("databaseId"),
+                "user": {"login": (r.get("author") or {}).get("login", "unknown")},
+                "state": r.get("state"),
+                "submitted_at": r.get("submittedAt"),
+            }
+            for r in nodes["reviews"]
+        ],
+        "comments": [
+            c for thread in nodes["reviewThreads"] for c in thread_comments(api, thread)
+        ],
+    })
+
+
 @app.command()
 def init_review(
     repo: str = typer.Argument(..., help="Repository in owner/repo format"),
     pr_number: int = typer.Argument(..., help="Pull request number"),
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file path"),
+    full: bool = typer.Option(False, "--full", help="Also record the PR's changed files in the review file"),
 ):
     """Initialize a review JSON file with PR metadata."""
     owner, repo_name = parse_repo(repo)
     api = get_api(owner, repo_name)
 
-    # Get head commit SHA
-    pr = api.pulls.get(pr_number)
-    commit_id = pr.get("head", {}).get("sha", "")
+    # Get head commit SHA (and, with --full, the file list in the same request)
+    files: Optional[list[dict]] = None
+    if full:
+        data = graphql(api, PR_HEAD_AND_FILES_QUERY, owner=owner, repo=repo_name, number=pr_number)
+        pr = (data.get("repository") or {}).get("pullRequest") or {}
+        commit_id = pr.get("headRefOid") or ""
+        files = [
+            file_summary(f)
+            for f in pr_connection_nodes(api, owner, repo_name, pr_number, pr, FILES_QUERY, "files")
+        ]
+    else:
+        _, commit_id = get_pr_head(api, owner, repo_name, pr_number)
 
     if not commit_id:
         console.print("[red]Error: Could not get head commit SHA[/red]")
@@ -558,11 +1269,13 @@ def init_review(
         "event": "COMMENT",
         "comments": [],
     }
+    if files is not None:
+        review_data["files"] = files
 
     if output is None:
         output = Path(f"/tmp/pr-review-{owner}-{repo_name}-{pr_number}.json")
 
-    output.write_text(json.dumps(review_data, indent=2))
+    output.write_bytes(orjson.dumps(review_data, option=orjson.OPT_INDENT_2))
     console.print(f"[green]Created review file: {output}[/green]")
     print(str(output))
 
@@ -577,41 +1290,46 @@ def issue(
     owner, repo_name = parse_repo(repo)
     api = get_api(owner, repo_name)
 
-    issue_data = api.issues.get(issue_number)
+    issue_data = cached_get(api.issues.get, issue_number)
 
     if raw:
-        print(json.dumps(dict(issue_data), indent=2, default=str))
+        print_json(issue_data)
         return
 
+    # Read every field once up front; the rendering below only uses locals
+    title = issue_data.get("title", "")
     state = issue_data.get("state", "unknown")
-    state_color = "green" if state == "open" else "red" if state == "closed" else "yellow"
+    author = (issue_data.get("user") or {}).get("login", "unknown")
+    created = (issue_data.get("created_at") or "")[:10]
+    updated = (issue_data.get("updated_at") or "")[:10]
+    label_names = [l.get("name", "") for l in issue_data.get("labels") or []]
+    assignee_names = [a.get("login", "") for a in issue_data.get("assignees") or []]
+    body = issue_data.get("body")
+
+    state_color = ISSUE_STATE_COLORS.get(state, "yellow")
 
     console.print(f"\n[bold cyan]Issue #{issue_number}[/bold cyan]")
-    console.print(f"[bold]{issue_data.get('title', '')}[/bold]")
+    console.print(f"[bold]{title}[/bold]")
     console.print(f"[{state_color}]{state.upper()}[/{state_color}]\n")
 
     # Author and dates
-    console.print(f"[dim]Created by {issue_data.get('user', {}).get('login', 'unknown')}[/dim]")
-    console.print(f"[dim]Created: {issue_data.get('created_at', '')[:10]}[/dim]")
-    if issue_data.get("updated_at"):
-        console.print(f"[dim]Updated: {issue_data.get('updated_at', '')[:10]}[/dim]")
+    console.print(f"[dim]Created by {author}[/dim]")
+    console.print(f"[dim]Created: {created}[/dim]")
+    if updated:
+        console.print(f"[dim]Updated: {updated}[/dim]")
 
     # Labels
-    labels = issue_data.get("labels", [])
-    if labels:
-        label_names = [l.get("name", "") for l in labels]
+    if label_names:
         console.print(f"\n[bold]Labels:[/bold] {', '.join(label_names)}")
 
     # Assignees
-    assignees = issue_data.get("assignees", [])
-    if assignees:
-        assignee_names = [a.get("login", "") for a in assignees]
+    if assignee_names:
         console.print(f"[bold]Assignees:[/bold] {', '.join(assignee_names)}")
 
     # Body
-    if issue_data.get("body"):
+    if body:
         console.print("\n[bold]Description:[/bold]")
-        console.print(issue_data.get("body", ""))
+        console.print(body)
 
 
 if __name__ == "__main__":